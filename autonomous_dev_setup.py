@@ -12,94 +12,49 @@ This script sets up:
 
 import subprocess
 import json
+import py_compile
+import shlex
+import shutil
+import string
+import threading
 import time
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
 from github_manager import GitHubManager
+import claude_control
 
-class AutonomousDevTeam:
-    def __init__(self, base_dir: str = None):
-        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent
-        self.session_name = "autonomous-dev-team"
-        self.projects = {}
-        self.github_manager = GitHubManager(os.getenv("GITHUB_TOKEN"))
+# Absolute tmux path: with it and close_fds=False, subprocess can create the
+# process with posix_spawn (vfork on Linux) instead of fork + exec.  Python's
+# own descriptors are non-inheritable, so close_fds=False leaks nothing.
+TMUX_BIN = shutil.which("tmux") or "tmux"
 
-    def create_master_orchestrator(self):
-        """Create the master orchestrator session"""
-        print("🚀 Creating Master Orchestrator...")
-        
-        # Create main orchestrator session
-        cmd = ["tmux", "new-session", "-d", "-s", self.session_name, "-x", "120", "-y", "30"]
-        subprocess.run(cmd, check=True)
-        
-        # Rename window to Orchestrator
-        subprocess.run(["tmux", "rename-window", "-t", f"{self.session_name}:0", "Orchestrator"], check=True)
-        
-        # Send initial orchestrator prompt
-        orchestrator_prompt = self._get_orchestrator_prompt()
-        self._send_to_window(f"{self.session_name}:0", orchestrator_prompt)
-        
-        print("✅ Master Orchestrator created in session 'autonomous-dev-team:0'")
-        
-    def add_project(self, project_name: str, project_type: str, repo_path: str, requirements: List[str]):
-        """Add a new project with its own PM and dev team"""
-        print(f"📁 Setting up project: {project_name}")
-        
-        # Find next available window
-        window_num = len(self.projects) + 1
-        
-        # Create project manager window
-        pm_window = f"{self.session_name}:{window_num}"
-        subprocess.run(["tmux", "new-window", "-t", self.session_name, "-n", f"PM-{project_name}"], check=True)
-        
-        # Create development team windows
-        dev_windows = {}
-        for i, role in enumerate(["Frontend", "Backend", "DevOps", "QA"], 1):
-            dev_window_num = window_num + i
-            dev_window = f"{self.session_name}:{dev_window_num}"
-            subprocess.run(["tmux", "new-window", "-t", self.session_name, "-n", f"{role}-{project_name}"], check=True)
-            dev_windows[role.lower()] = dev_window
-        
-        # Store project info
-        self.projects[project_name] = {
-            "type": project_type,
-            "repo_path": repo_path,
-            "requirements": requirements,
-            "pm_window": pm_window,
-            "dev_windows": dev_windows,
-            "window_base": window_num
-        }
-        
-        # Initialize Project Manager
-        pm_prompt = self._get_pm_prompt(project_name, project_type, repo_path, requirements, dev_windows)
-        self._send_to_window(pm_window, pm_prompt)
-        
-        # Initialize Developer agents
-        for role, window in dev_windows.items():
-            dev_prompt = self._get_developer_prompt(role, project_name, project_type, repo_path)
-            self._send_to_window(window, dev_prompt)
-        
-        print(f"✅ Project {project_name} team created:")
-        print(f"   PM: {pm_window}")
-        for role, window in dev_windows.items():
-            print(f"   {role.title()}: {window}")
-    
-    def setup_monitoring(self):
-        """Set up automated monitoring and scheduling"""
-        print("📊 Setting up autonomous monitoring...")
-        
-        # Create monitoring script
-        monitor_script = self.base_dir / "autonomous_monitor.py"
-        self._create_monitoring_script(monitor_script)
-        
-        # Schedule regular check-ins
-        self._schedule_orchestrator_checkins()
-        
-        print("✅ Monitoring system activated")
-    
-    def _get_orchestrator_prompt(self) -> str:
-        return f"""You are the Master Orchestrator for an autonomous development team.
+# Command run as the initial process of every agent window.  Resolved here
+# because the tmux server's PATH may differ from the caller's.
+CLAUDE_CMD = shutil.which("claude") or "claude"
+
+# Agent windows silent for this long trigger tmux's alert-silence hook,
+# which tells the orchestrator the agent may be blocked
+AGENT_SILENCE_ALERT = 3600  # seconds
+
+# Text shown by Claude once it is ready to accept a prompt
+CLAUDE_READY_MARKERS = ("? for shortcuts", "│ >")
+CLAUDE_READY_TIMEOUT = 5.0  # seconds
+
+# Development roles created for every project, in window order
+DEV_ROLES = ("Frontend", "Backend", "DevOps", "QA")
+
+# Role specialisations used in developer prompts
+_ROLE_TASKS = {
+    "frontend": "UI/UX implementation, client-side logic, responsive design, user interactions",
+    "backend": "Server-side logic, APIs, database design, authentication, performance optimization", 
+    "devops": "Infrastructure, deployment pipelines, monitoring, security, environment management",
+    "qa": "Test planning, automated testing, manual testing, bug reporting, quality assurance"
+}
+
+# Prompt templates, compiled once at import time
+_ORCHESTRATOR_TEMPLATE = string.Template("""You are the Master Orchestrator for an autonomous development team.
 
 ROLE: High-level oversight and coordination across all projects
 RESPONSIBILITIES:
@@ -110,13 +65,13 @@ RESPONSIBILITIES:
 - Escalate critical issues requiring human intervention
 
 CURRENT SETUP:
-- Session: {self.session_name}
+- Session: $session_name
 - Window: 0 (Orchestrator)
-- Projects: {list(self.projects.keys()) if self.projects else "None yet"}
+- Projects: $projects
 
 COMMANDS AVAILABLE:
-- Use `python3 {self.base_dir}/claude_control.py status` to check all team status
-- Use `python3 {self.base_dir}/claude_control.py snapshot` for detailed monitoring
+- Use `python3 $base_dir/$control_app status` to check all team status
+- Use `python3 $base_dir/$control_app snapshot` for detailed monitoring
 - Use `./schedule_with_note.sh <minutes> "<note>"` to schedule your own check-ins
 
 AUTONOMOUS BEHAVIORS:
@@ -131,20 +86,18 @@ NEXT ACTIONS:
 3. Set up your first 2-hour check-in schedule
 4. Begin monitoring project progress
 
-Start by saying "ORCHESTRATOR ONLINE" and then proceed with setup."""
+Start by saying "ORCHESTRATOR ONLINE" and then proceed with setup.""")
 
-    def _get_pm_prompt(self, project_name: str, project_type: str, repo_path: str, 
-                      requirements: List[str], dev_windows: Dict[str, str]) -> str:
-        return f"""You are the Project Manager for {project_name}.
+_PM_TEMPLATE = string.Template("""You are the Project Manager for $project_name.
 
 PROJECT DETAILS:
-- Name: {project_name}
-- Type: {project_type}
-- Repository: {repo_path}
-- Requirements: {', '.join(requirements)}
+- Name: $project_name
+- Type: $project_type
+- Repository: $repo_path
+- Requirements: $requirements
 
 YOUR TEAM:
-{chr(10).join([f"- {role.title()}: {window}" for role, window in dev_windows.items()])}
+$team
 
 RESPONSIBILITIES:
 - Coordinate development across your team
@@ -161,30 +114,22 @@ AUTONOMOUS BEHAVIORS:
 4. Escalate to Orchestrator if project is at risk
 
 COMMANDS:
-- Use `python3 {self.base_dir}/send-claude-message.sh <window> "<message>"` to communicate with team
-- Use `./schedule_with_note.sh 30 "Check team progress on {project_name}"` for scheduling
+- Use `python3 $base_dir/send-claude-message.sh <window> "<message>"` to communicate with team
+- Use `./schedule_with_note.sh 30 "Check team progress on $project_name"` for scheduling
 
 IMMEDIATE ACTIONS:
-1. Acknowledge your role as PM for {project_name}
+1. Acknowledge your role as PM for $project_name
 2. Review project requirements and create initial task breakdown
 3. Assign initial tasks to your development team
 4. Set up your first 30-min check-in schedule
 
-Start by saying "PM {project_name.upper()} ONLINE" and begin coordinating your team."""
+Start by saying "PM $project_name_upper ONLINE" and begin coordinating your team.""")
 
-    def _get_developer_prompt(self, role: str, project_name: str, project_type: str, repo_path: str) -> str:
-        role_specific_tasks = {
-            "frontend": "UI/UX implementation, client-side logic, responsive design, user interactions",
-            "backend": "Server-side logic, APIs, database design, authentication, performance optimization", 
-            "devops": "Infrastructure, deployment pipelines, monitoring, security, environment management",
-            "qa": "Test planning, automated testing, manual testing, bug reporting, quality assurance"
-        }
-        
-        return f"""You are a {role.title()} Engineer on the {project_name} project.
+_DEV_TEMPLATE = string.Template("""You are a $role_title Engineer on the $project_name project.
 
-PROJECT: {project_name} ({project_type})
-REPOSITORY: {repo_path}
-SPECIALIZATION: {role_specific_tasks.get(role.lower(), "General development tasks")}
+PROJECT: $project_name ($project_type)
+REPOSITORY: $repo_path
+SPECIALIZATION: $specialization
 
 RESPONSIBILITIES:
 - Implement features assigned by your Project Manager
@@ -208,34 +153,391 @@ GIT DISCIPLINE (CRITICAL):
 - Create feature branches for major changes
 
 NEXT ACTIONS:
-1. Acknowledge your role as {role.title()} Engineer  
+1. Acknowledge your role as $role_title Engineer  
 2. Check repository status and current codebase
 3. Wait for task assignment from your PM
 4. Set up development environment if needed
 
-Start by saying "{role.upper()} ENGINEER ONLINE - {project_name.upper()}" and await instructions from your PM."""
+Start by saying "$role_upper ENGINEER ONLINE - $project_name_upper" and await instructions from your PM.""")
 
-    def _send_to_window(self, window: str, message: str):
-        """Send a message to a specific tmux window"""
-        # Clear any existing content
-        subprocess.run(["tmux", "send-keys", "-t", window, "C-c"], check=False)
-        time.sleep(0.5)
+class AutonomousDevTeam:
+    __slots__ = (
+        "base_dir", "session_name", "projects", "_projects_lock", "_next_window",
+        "_tmux", "_tmux_lock", "_control_app", "_github_manager",
+        "_base_dir_str", "_orchestrator_template", "_pm_template",
+    )
+
+    def __init__(self, base_dir: str = None, session_name: str = "autonomous-dev-team"):
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent
+        self.session_name = session_name
+        self._base_dir_str = str(self.base_dir)
+        # Bind the fields that never change after construction into the
+        # prompt templates once, leaving only per-call fields to substitute
+        constants = {
+            "session_name": self.session_name.replace("$", "$$"),
+            "base_dir": self._base_dir_str.replace("$", "$$"),
+        }
+        self._orchestrator_template = string.Template(
+            _ORCHESTRATOR_TEMPLATE.safe_substitute(constants))
+        self._pm_template = string.Template(_PM_TEMPLATE.safe_substitute(constants))
+        self.projects = {}
+        self._projects_lock = threading.Lock()  # guards projects/window numbering
+        self._next_window = 1  # window 0 is the orchestrator
+        self._tmux = None  # persistent ``tmux -C`` control client
+        self._tmux_lock = threading.RLock()  # one command batch on the pipe at a time
+        self._control_app = "claude_control.py"  # replaced by the zipapp once built
+        self._github_manager = None
+
+    @property
+    def github_manager(self) -> GitHubManager:
+        """GitHub client, created (and GITHUB_TOKEN read) on first use"""
+        if self._github_manager is None:
+            self._github_manager = GitHubManager(self._base_dir_str, os.getenv("GITHUB_TOKEN"))
+        return self._github_manager
+
+    def create_master_orchestrator(self):
+        """Create the master orchestrator session"""
+        print("🚀 Creating Master Orchestrator...")
         
-        # Send claude command to start AI
-        subprocess.run(["tmux", "send-keys", "-t", window, "claude"], check=True)
-        time.sleep(2)
+        # Create main orchestrator session with window 0 already named and
+        # running claude directly rather than through a shell
+        self._run_tmux(
+            ["new-session", "-d", "-s", self.session_name, "-n", "Orchestrator",
+             "-x", "120", "-y", "30", CLAUDE_CMD],
+        )
+        
+        # Route all further tmux commands through one control-mode client
+        self._open_control_client()
+        
+        # Agents call claude_control repeatedly; give them the fast zipapp
+        self._build_control_app()
         
-        # Send the prompt
-        subprocess.run(["tmux", "send-keys", "-t", window, message, "Enter"], check=True)
+        # Send initial orchestrator prompt
+        orchestrator_prompt = self._get_orchestrator_prompt()
+        self._send_to_window(f"{self.session_name}:0", orchestrator_prompt)
+        
+        print("✅ Master Orchestrator created in session 'autonomous-dev-team:0'")
+        
+    def add_project(self, project_name: str, project_type: str, repo_path: str, requirements: List[str]):
+        """Add a new project with its own PM and dev team"""
+        print(f"📁 Setting up project: {project_name}")
+        
+        with self._projects_lock:
+            window_num, pm_window, dev_windows = self._create_project_windows(project_name)
+            
+            # Store project info
+            self.projects[project_name] = {
+                "type": project_type,
+                "repo_path": repo_path,
+                "requirements": requirements,
+                "pm_window": pm_window,
+                "dev_windows": dev_windows,
+                "window_base": window_num
+            }
+        
+        # Initialize Project Manager
+        pm_prompt = self._get_pm_prompt(project_name, project_type, repo_path, requirements, dev_windows)
+        self._send_to_window(pm_window, pm_prompt)
+        
+        # Initialize Developer agents
+        for role, window in dev_windows.items():
+            dev_prompt = self._get_developer_prompt(role, project_name, project_type, repo_path)
+            self._send_to_window(window, dev_prompt)
+        
+        print(f"✅ Project {project_name} team created:")
+        print(f"   PM: {pm_window}")
+        for role, window in dev_windows.items():
+            print(f"   {role.title()}: {window}")
+    
+    def _create_project_windows(self, project_name: str):
+        """Create a project's PM and dev windows; caller holds the projects lock"""
+        # Reserve a block of window indices: PM plus one per role
+        window_num = self._next_window
+        self._next_window += 1 + len(DEV_ROLES)
+        
+        # Project manager window
+        pm_window = f"{self.session_name}:{window_num}"
+        window_cmds = [["new-window", "-t", pm_window, "-n", f"PM-{project_name}", CLAUDE_CMD]]
+        
+        # Development team windows, created at their reserved indices; every
+        # window runs claude as its own process, so it closes when claude exits
+        dev_windows = {}
+        for i, role in enumerate(DEV_ROLES, 1):
+            dev_window_num = window_num + i
+            dev_window = f"{self.session_name}:{dev_window_num}"
+            window_cmds.append(["new-window", "-t", dev_window, "-n", f"{role}-{project_name}", CLAUDE_CMD])
+            dev_windows[role.lower()] = dev_window
+        
+        for window in [pm_window, *dev_windows.values()]:
+            window_cmds.append(["set-option", "-w", "-t", window,
+                                "monitor-silence", str(AGENT_SILENCE_ALERT)])
+        
+        # Create all of the project's windows with a single tmux invocation
+        self._run_tmux(*window_cmds)
+        return window_num, pm_window, dev_windows
+    
+    def setup_monitoring(self):
+        """Set up automated monitoring and scheduling"""
+        print("📊 Setting up autonomous monitoring...")
+        
+        # Create monitoring script
+        monitor_script = self.base_dir / "autonomous_monitor.py"
+        self._create_monitoring_script(monitor_script)
+        
+        # Schedule regular check-ins
+        self._schedule_orchestrator_checkins()
+        
+        print("✅ Monitoring system activated")
+    
+    def _get_orchestrator_prompt(self) -> str:
+        return self._orchestrator_template.substitute(
+            projects=list(self.projects.keys()) if self.projects else "None yet",
+            control_app=self._control_app,
+        )
+
+    def _get_pm_prompt(self, project_name: str, project_type: str, repo_path: str, 
+                      requirements: List[str], dev_windows: Dict[str, str]) -> str:
+        return self._pm_template.substitute(
+            project_name=project_name,
+            project_name_upper=project_name.upper(),
+            project_type=project_type,
+            repo_path=repo_path,
+            requirements=', '.join(requirements),
+            team="\n".join(f"- {role.title()}: {window}" for role, window in dev_windows.items()),
+        )
+
+    def _get_developer_prompt(self, role: str, project_name: str, project_type: str, repo_path: str) -> str:
+        return _DEV_TEMPLATE.substitute(
+            role_title=role.title(),
+            role_upper=role.upper(),
+            project_name=project_name,
+            project_name_upper=project_name.upper(),
+            project_type=project_type,
+            repo_path=repo_path,
+            specialization=_ROLE_TASKS.get(role.lower(), "General development tasks"),
+        )
+
+    def _build_control_app(self):
+        """Build claude_control.pyz, falling back to the plain script on failure"""
+        try:
+            archive = claude_control.build_zipapp(self.base_dir / "claude_control.pyz")
+            self._control_app = archive.name
+        except Exception as e:
+            print(f"⚠️ Could not build claude_control.pyz, using claude_control.py: {e}")
+
+    def _open_control_client(self):
+        """Attach a ``tmux -C`` control-mode client to the session.
+
+        Commands written to its stdin are answered with ``%begin``/``%end``
+        blocks on stdout, so no new tmux process is spawned per command.
+        """
+        try:
+            self._tmux = subprocess.Popen(
+                [TMUX_BIN, "-C", "attach-session", "-t", self.session_name],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL, text=True
+            )
+            # The client is only attached once tmux closes the attach-session
+            # block; a refresh-client sent earlier fails with "no current client"
+            for reply in self._tmux.stdout:
+                if reply.startswith(("%end ", "%error ")):
+                    break
+            else:
+                raise BrokenPipeError("tmux control client exited")
+            # Stop every pane's %output from piling up in the pipe between
+            # replies.  tmux before 3.2 rejects the flag, which is harmless
+            try:
+                self._tmux_cmd("refresh-client -f no-output")
+            except RuntimeError:
+                pass
+        except (OSError, BrokenPipeError) as e:
+            print(f"⚠️ tmux control mode unavailable, spawning tmux per command: {e}")
+            self._close_control_client()
+
+    def _close_control_client(self):
+        """Detach the control-mode client, if any"""
+        if self._tmux is not None:
+            try:
+                self._tmux.stdin.close()
+                self._tmux.wait(timeout=5)
+            except (OSError, subprocess.TimeoutExpired):
+                self._tmux.kill()
+            self._tmux = None
+
+    def _tmux_cmd(self, line: str) -> str:
+        """Send one command line to the control client and return its output.
+
+        Raises ``BrokenPipeError`` if the client has gone away and
+        ``RuntimeError`` if tmux answers with ``%error``.
+        """
+        self._tmux.stdin.write(line + "\n")
+        self._tmux.stdin.flush()
+        return self._read_control_reply()
+
+    def _read_control_reply(self) -> str:
+        """Read the next ``%begin``/``%end`` block answering a command we sent
+
+        Blocks whose flags field is not 1 belong to commands tmux ran itself
+        (hooks, key bindings) and are skipped along with notifications.
+        """
+        output = []
+        tag = None
+        for reply in self._tmux.stdout:
+            reply = reply.rstrip("\n")
+            if tag is None:
+                # Notifications (%output, %window-add, ...) arrive between blocks
+                if reply.startswith("%begin "):
+                    tag = reply[len("%begin "):]
+                    output = []
+            elif reply == f"%end {tag}":
+                if tag.endswith(" 1"):
+                    return "\n".join(output)
+                tag = None
+            elif reply == f"%error {tag}":
+                if tag.endswith(" 1"):
+                    raise RuntimeError("\n".join(output))
+                tag = None
+            else:
+                output.append(reply)
+        raise BrokenPipeError("tmux control client exited")
+
+    @staticmethod
+    def _tmux_quote(arg: str) -> str:
+        """Quote an argument for the tmux command parser (single line)"""
+        for char, escaped in (("\\", "\\\\"), ('"', '\\"'), ("$", "\\$"),
+                              ("\n", "\\n"), ("\r", "\\r"), ("\t", "\\t")):
+            arg = arg.replace(char, escaped)
+        return f'"{arg}"'
+
+    def _run_tmux(self, *commands: List[str], check: bool = True) -> str:
+        """Run several tmux commands and return their combined output.
+
+        Each command is an argv list without the leading ``tmux``. They go
+        through the control-mode client when it is open, otherwise through a
+        single tmux process chained with literal ``;`` separators as
+        described in tmux(1).
+        """
+        with self._tmux_lock:
+            if self._tmux is not None:
+                try:
+                    output = []
+                    for command in commands:
+                        line = " ".join(self._tmux_quote(arg) for arg in command)
+                        try:
+                            output.append(self._tmux_cmd(line))
+                        except RuntimeError:
+                            if check:
+                                raise subprocess.CalledProcessError(1, ["tmux", *command])
+                    return "\n".join(output)
+                except BrokenPipeError:
+                    print("⚠️ tmux control client lost, falling back to subprocess")
+                    self._close_control_client()
+        
+        argv = [TMUX_BIN]
+        for i, command in enumerate(commands):
+            if i:
+                argv.append(";")
+            argv.extend(command)
+        return subprocess.run(argv, capture_output=True, text=True, check=check,
+                              close_fds=False).stdout
+
+    def _load_buffer(self, buffer_name: str, data: str):
+        """Store text in a named tmux paste buffer.
+
+        The control client takes it as a single quoted ``set-buffer``
+        argument; without it the text is streamed to ``load-buffer -``.
+        """
+        with self._tmux_lock:
+            if self._tmux is not None:
+                self._run_tmux(["set-buffer", "-b", buffer_name, "--", data])
+                return
+        subprocess.run([TMUX_BIN, "load-buffer", "-b", buffer_name, "-"],
+                       input=data, text=True, check=True, close_fds=False)
+
+    def _wait_for_ready(self, window: str, timeout: float = CLAUDE_READY_TIMEOUT) -> bool:
+        """Poll a window until Claude's prompt is visible or the timeout expires.
+
+        Starts at 50 ms between polls and backs off up to 2 s.
+        """
+        interval = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            pane = self._run_tmux(["capture-pane", "-p", "-t", window], check=False)
+            if any(marker in pane for marker in CLAUDE_READY_MARKERS):
+                return True
+            time.sleep(interval)
+            interval = min(interval * 2, 2.0)
+        return False
+
+    def _send_to_window(self, window: str, message: str):
+        """Send a message to the claude instance running in a tmux window"""
+        # Windows are created running claude; wait for its prompt to appear
+        self._wait_for_ready(window)
+        
+        # Copy the prompt into a tmux buffer in bulk, paste it (bracketed, so
+        # newlines don't submit early) and submit it
+        buffer_name = f"prompt-{window}"
+        self._load_buffer(buffer_name, message)
+        self._run_tmux(
+            ["paste-buffer", "-p", "-d", "-b", buffer_name, "-t", window],
+            ["send-keys", "-t", window, "Enter"],
+        )
         
     def _schedule_orchestrator_checkins(self):
-        """Schedule automatic check-ins for the orchestrator"""
-        schedule_cmd = [
-            str(self.base_dir / "schedule_with_note.sh"),
-            "120",  # 2 hours
-            "Master Orchestrator: Check all project status and coordinate teams"
-        ]
-        subprocess.run(schedule_cmd, check=True)
+        """Schedule automatic check-ins for the orchestrator
+
+        Besides the 2-hour check-in, a session hook on ``alert-silence``
+        notifies the orchestrator as soon as an agent window has been
+        silent for AGENT_SILENCE_ALERT seconds, without any timer process.
+        """
+        message = (
+            f"Agent #{{hook_window_name}} has been silent for "
+            f"{AGENT_SILENCE_ALERT // 60} minutes and may be blocked. "
+            f"Review with: python3 {self.base_dir / self._control_app} snapshot"
+        )
+        job = self._message_job(f"{self.session_name}:0", message)
+        self._run_tmux(["set-hook", "-t", self.session_name, "alert-silence",
+                        f"run-shell -b {self._tmux_quote(job)}"])
+        
+        self._schedule_checkin(
+            120,  # 2 hours
+            "Master Orchestrator: Check all project status and coordinate teams",
+            f"{self.session_name}:0"
+        )
+
+    def _schedule_checkin(self, minutes: int, note: str, target: str):
+        """Schedule a check-in message to a window, like schedule_with_note.sh.
+
+        The note is written to next_check_note.txt and the delayed
+        ``send-keys`` runs as a tmux ``run-shell -b`` job, so no scheduler
+        script or extra tmux client is spawned here.
+        """
+        note_file = self.base_dir / "next_check_note.txt"
+        note_file.write_text(
+            f"=== Next Check Note ({time.strftime('%c')}) ===\n"
+            f"Scheduled for: {minutes} minutes\n\n"
+            f"{note}\n"
+        )
+        
+        message = (f'Time for orchestrator check! cat "{note_file}" && '
+                   f'python3 "{self.base_dir / self._control_app}" status detailed')
+        job = f"sleep {minutes * 60} && " + self._message_job(target, message)
+        self._run_tmux(["run-shell", "-b", job])
+        print(f"Scheduling check in {minutes} minutes with note: {note}")
+
+    def _message_job(self, target: str, message: str) -> str:
+        """Shell command for a ``run-shell`` job that types a message into a
+        window and submits it a second later.
+
+        A tmux ``wait-for`` lock keeps concurrent jobs from interleaving
+        their text before the Enter.
+        """
+        target = shlex.quote(target)
+        lock = shlex.quote(f"{self.session_name}-messages")
+        return (f"tmux wait-for -L {lock} && "
+                f"tmux send-keys -t {target} {shlex.quote(message)} && "
+                f"sleep 1 && tmux send-keys -t {target} Enter; "
+                f"tmux wait-for -U {lock}")
         
     def _create_monitoring_script(self, script_path: Path):
         """Create autonomous monitoring script"""
@@ -245,45 +547,107 @@ Autonomous Team Monitor
 Runs continuously to monitor team health and progress
 """
 
+import os
+import signal
+import sys
+import threading
 import time
-import subprocess
-import json
 from datetime import datetime
 
+# tmux_utils.py sits next to this script, so it is importable directly
+from tmux_utils import TmuxOrchestrator
+
+# Adaptive polling: back off while the team is healthy, poll densely after
+# an issue until it has been confirmed clear three times in a row.
+BASE_INTERVAL = 60  # seconds
+MAX_INTERVAL = 900
+BACKOFF = 1.5
+DENSE_INTERVAL = 30
+DENSE_POLLS = 3
+
+# One list-windows call reports every window's history size and last
+# activity; only windows where either changed get their pane captured.
+IDLE_SECONDS = 1800  # no output for this long counts as inactive
+ERROR_MARKERS = ("Traceback (most recent call last)", "command not found")
+
+last_seen = {}  # window_id -> (history_size, window_activity)
+orchestrator = TmuxOrchestrator()  # kept across ticks, replaced after a failure
+
 def check_team_health():
-    """Check if all agents are responsive and making progress"""
+    """Check if all agents are responsive and making progress.
+
+    Returns True when no issues were found.
+    """
+    global orchestrator
     try:
-        result = subprocess.run(
-            ["python3", "claude_control.py", "status", "detailed"],
-            capture_output=True, text=True, check=True
-        )
-        status = json.loads(result.stdout)
-        
-        # Analyze team health
+        now = time.time()
         issues = []
-        for session in status.get("sessions", []):
-            for window in session.get("windows", []):
-                # Check for inactive windows (no recent activity)
-                if not window.get("active", False):
-                    issues.append(f"Inactive: {window.get('name', 'unknown')}")
+        seen = {}
+        windows = orchestrator.get_window_activity()
+        if not windows:
+            issues.append("No tmux windows found")
+        for window in windows:
+            seen[window["id"]] = (window["history_size"], window["activity"])
+            if last_seen.get(window["id"]) == seen[window["id"]]:
+                # Unchanged since the last tick: no need to capture the pane
+                if now - window["activity"] > IDLE_SECONDS:
+                    issues.append(f"Inactive: {window['name']}")
+                continue
+            
+            # Changed: capture only the visible region and scan it for errors
+            pane = orchestrator.capture_window_content(
+                window["session_name"], window["index"], num_lines=0
+            )
+            if any(marker in pane for marker in ERROR_MARKERS):
+                issues.append(f"Errors: {window['name']}")
+        
+        last_seen.clear()
+        last_seen.update(seen)
         
         if issues:
             print(f"[{datetime.now()}] Team health issues detected:")
             for issue in issues:
                 print(f"  - {issue}")
-        else:
-            print(f"[{datetime.now()}] All team members active and healthy")
+            return False
+        
+        print(f"[{datetime.now()}] All team members active and healthy")
+        return True
             
     except Exception as e:
         print(f"[{datetime.now()}] Monitoring error: {e}")
+        orchestrator = TmuxOrchestrator()
+        return False
 
 def main():
     """Main monitoring loop"""
     print("🤖 Autonomous Team Monitor starting...")
     
-    while True:
-        check_team_health()
-        time.sleep(600)  # Check every 10 minutes
+    stop = threading.Event()
+    reload_requested = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop.set())
+    
+    def request_reload(signum, frame):
+        reload_requested.set()
+        stop.set()
+    
+    # SIGHUP restarts the monitor so a regenerated script takes effect
+    signal.signal(signal.SIGHUP, request_reload)
+    
+    interval = BASE_INTERVAL
+    dense_polls = 0
+    while not stop.is_set():
+        if not check_team_health():
+            interval = DENSE_INTERVAL
+            dense_polls = DENSE_POLLS
+        elif dense_polls:
+            dense_polls -= 1
+        else:
+            interval = min(interval * BACKOFF, MAX_INTERVAL)
+        stop.wait(interval)
+    
+    if reload_requested.is_set():
+        print("🔄 Reloading monitor...")
+        os.execv(sys.executable, [sys.executable] + sys.argv)
 
 if __name__ == "__main__":
     main()
@@ -291,12 +655,16 @@ if __name__ == "__main__":
         
         script_path.write_text(monitoring_code)
         script_path.chmod(0o755)
+        
+        # Byte-compile alongside the source; ``python3 autonomous_monitor.pyc``
+        # then starts without parsing the script again
+        py_compile.compile(str(script_path), cfile=str(script_path) + "c", doraise=True)
     
     def get_status(self):
         """Get current status of all teams"""
         try:
             result = subprocess.run([
-                "python3", str(self.base_dir / "claude_control.py"), "status"
+                "python3", str(self.base_dir / self._control_app), "status"
             ], capture_output=True, text=True, check=True)
             return result.stdout
         except subprocess.CalledProcessError as e:
@@ -314,13 +682,13 @@ if __name__ == "__main__":
         for project_name, project_info in self.projects.items():
             base_window = project_info["window_base"]
             print(f"  {base_window}: PM-{project_name}")
-            for i, role in enumerate(["Frontend", "Backend", "DevOps", "QA"], 1):
+            for i, role in enumerate(DEV_ROLES, 1):
                 print(f"  {base_window + i}: {role}-{project_name}")
         
         print("\nCOMMANDS:")
         print(f"  tmux attach -t {self.session_name}  # Connect to team")
-        print(f"  python3 {self.base_dir}/claude_control.py status  # Check status")
-        print(f"  python3 {self.base_dir}/autonomous_monitor.py &  # Start monitoring")
+        print(f"  python3 {self.base_dir}/{self._control_app} status  # Check status")
+        print(f"  python3 {self.base_dir}/autonomous_monitor.pyc &  # Start monitoring")
         
         print("\nYour autonomous dev team is now working 24/7! 🚀")
 
@@ -391,21 +759,25 @@ def main():
         }
     ]
     
-    # Set up sample projects (you can modify or add more)
-    for project in sample_projects:
-        team.add_project(
-            project["name"],
-            project["type"],
-            project["repo_path"], 
-            project["requirements"]
-        )
-        time.sleep(1)
+    # Set up sample projects (you can modify or add more) concurrently;
+    # most of the time is spent waiting on tmux and Claude start-up
+    with ThreadPoolExecutor(max_workers=min(8, len(sample_projects))) as executor:
+        list(executor.map(
+            lambda project: team.add_project(
+                project["name"],
+                project["type"],
+                project["repo_path"], 
+                project["requirements"]
+            ),
+            sample_projects
+        ))
     
     # Set up monitoring
     team.setup_monitoring()
     
     # Show summary
     team.show_setup_summary()
+    team._close_control_client()
 
 if __name__ == "__main__":
     main()
@@ -21,6 +21,11 @@ Usage::
         an AI agent.  This uses the ``create_monitoring_snapshot()``
         method of the ``TmuxOrchestrator`` class.
 
+    python3 claude_control.py build
+        Bundle this script and ``tmux_utils`` into ``claude_control.pyz``,
+        a byte‑compiled zipapp that starts faster for repeated calls.
+        Run it as ``python3 claude_control.pyz status``.
+
 All output is printed to standard output.  The script exits with
 non‑zero status on error or if an unknown command is supplied.
 """
@@ -28,22 +33,113 @@ non‑zero status on error or if an unknown command is supplied.
 from __future__ import annotations
 
 import json
+import subprocess
 import sys
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Tuple
 
-# Import the orchestrator utilities.  ``tmux_utils.py`` resides in the
-# same directory as this script; modifying ``sys.path`` ensures Python
-# discovers it regardless of the current working directory.
 from pathlib import Path
 
 SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
 
-try:
-    from tmux_utils import TmuxOrchestrator  # type: ignore
-except Exception as exc:
-    print(f"Error importing tmux_utils: {exc}", file=sys.stderr)
-    sys.exit(1)
+# Modules bundled into the zipapp produced by ``build``
+ZIPAPP_MODULES = ("claude_control.py", "tmux_utils.py")
+
+
+def _orchestrator():
+    """Import ``tmux_utils`` on demand and return a ``TmuxOrchestrator``.
+
+    Only ``status detailed`` and ``snapshot`` need it, so the plain
+    ``status`` command never pays for the import.  ``tmux_utils.py``
+    resides in the same directory as this script; modifying ``sys.path``
+    ensures Python discovers it regardless of the current working
+    directory.
+    """
+    if str(SCRIPT_DIR) not in sys.path:
+        sys.path.insert(0, str(SCRIPT_DIR))
+    try:
+        from tmux_utils import TmuxOrchestrator  # type: ignore
+    except Exception as exc:
+        print(f"Error importing tmux_utils: {exc}", file=sys.stderr)
+        sys.exit(1)
+    return TmuxOrchestrator()
+
+# Format used by the ``status`` fast path: one tab-separated line per window
+# across every session.  The window name comes last since it may contain tabs.
+STATUS_FORMAT = (
+    "#{session_name}\t#{session_attached}\t#{window_index}\t"
+    "#{window_active}\t#{window_name}"
+)
+
+
+def _list_all_windows() -> Dict[str, Tuple[bool, List[Tuple[str, bool, str]]]]:
+    """Return every session's windows using a single ``tmux`` invocation.
+
+    The result maps session names to ``(attached, windows)`` where each
+    window is ``(index, active, name)``.  Sessions keep tmux's ordering.
+    """
+    result = subprocess.run(
+        ["tmux", "list-windows", "-a", "-F", STATUS_FORMAT],
+        capture_output=True, text=True, check=True,
+    )
+    sessions: Dict[str, Tuple[bool, List[Tuple[str, bool, str]]]] = {}
+    for line in result.stdout.splitlines():
+        parts = line.split("\t", 4)
+        if len(parts) != 5:
+            continue
+        session_name, attached, index, active, name = parts
+        if session_name not in sessions:
+            sessions[session_name] = (attached != "0", [])
+        sessions[session_name][1].append((index, active == "1", name))
+    return sessions
+
+
+def get_status(detailed: bool = False) -> Dict:
+    """Return the status document for every tmux session.
+
+    With ``detailed`` this is ``TmuxOrchestrator.get_all_windows_status()``,
+    as printed by ``status detailed``.  Otherwise the document has the
+    same shape minus each window's ``info``, and is built from a single
+    ``tmux`` call whose errors propagate to the caller.
+    """
+    if detailed:
+        return _orchestrator().get_all_windows_status()
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "sessions": [
+            {
+                "name": name,
+                "attached": attached,
+                "windows": [
+                    {"index": int(index), "name": window_name, "active": active}
+                    for index, active, window_name in windows
+                ],
+            }
+            for name, (attached, windows) in _list_all_windows().items()
+        ],
+    }
+
+
+def _write_json(data) -> None:
+    """Write ``data`` as JSON to standard output.
+
+    Terminals get the indented form.  Otherwise the output is meant for
+    another program, so it is written compactly: with ``orjson`` when it
+    is installed, else streamed by ``json.dump`` without building the
+    whole string first.
+    """
+    if sys.stdout.isatty():
+        print(json.dumps(data, indent=2))
+        return
+
+    try:
+        import orjson  # type: ignore
+    except ImportError:
+        json.dump(data, sys.stdout, separators=(",", ":"))
+        sys.stdout.write("\n")
+        return
+    sys.stdout.flush()
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE))
 
 
 def cmd_status(args: List[str]) -> int:
@@ -55,34 +151,79 @@ def cmd_status(args: List[str]) -> int:
 
     Returns a process exit code (0 on success).
     """
-    orchestrator = TmuxOrchestrator()
     if args and args[0] == "detailed":
-        status = orchestrator.get_all_windows_status()
-        print(json.dumps(status, indent=2))
+        _write_json(get_status(detailed=True))
         return 0
 
-    sessions = orchestrator.get_tmux_sessions()
+    try:
+        sessions = _list_all_windows()
+    except FileNotFoundError:
+        print(
+            "Warning: 'tmux' executable not found. Install tmux to use the "
+            "orchestrator features."
+        )
+        sessions = {}
+    except subprocess.CalledProcessError as e:
+        # No tmux server running
+        print(f"Error getting tmux sessions: {e}")
+        sessions = {}
+
     if not sessions:
         print("No tmux sessions found.")
         return 0
 
-    for sess in sessions:
-        attached = "attached" if sess.attached else "detached"
-        print(f"Session '{sess.name}' ({attached}):")
-        for win in sess.windows:
-            active = "*" if win.active else " "
-            print(f"  [{active}] {win.window_index}: {win.window_name}")
+    for name, (is_attached, windows) in sessions.items():
+        attached = "attached" if is_attached else "detached"
+        print(f"Session '{name}' ({attached}):")
+        for index, is_active, window_name in windows:
+            active = "*" if is_active else " "
+            print(f"  [{active}] {index}: {window_name}")
     return 0
 
 
 def cmd_snapshot(args: List[str]) -> int:
     """Generate a monitoring snapshot for AI agents to consume."""
-    orchestrator = TmuxOrchestrator()
+    orchestrator = _orchestrator()
     snapshot = orchestrator.create_monitoring_snapshot()
     print(snapshot)
     return 0
 
 
+def build_zipapp(target: Path | None = None) -> Path:
+    """Bundle this script and ``tmux_utils`` into an executable zipapp.
+
+    The modules are byte‑compiled next to their sources (legacy ``.pyc``
+    layout) so ``zipimport`` loads them without compiling.  Returns the
+    path of the archive, ``claude_control.pyz`` beside this script unless
+    ``target`` is given.
+    """
+    import compileall
+    import shutil
+    import tempfile
+    import zipapp
+
+    target = Path(target) if target else SCRIPT_DIR / "claude_control.pyz"
+    with tempfile.TemporaryDirectory() as staging:
+        staging_dir = Path(staging)
+        for name in ZIPAPP_MODULES:
+            shutil.copy2(SCRIPT_DIR / name, staging_dir / name)
+        (staging_dir / "__main__.py").write_text(
+            "import sys\n"
+            "from claude_control import main\n"
+            "sys.exit(main(sys.argv[1:]))\n"
+        )
+        compileall.compile_dir(staging, quiet=1, legacy=True)
+        zipapp.create_archive(staging_dir, target, interpreter="/usr/bin/env python3")
+    return target
+
+
+def cmd_build(args: List[str]) -> int:
+    """Build ``claude_control.pyz`` (or the path given as an argument)."""
+    target = build_zipapp(Path(args[0]) if args else None)
+    print(f"Built {target}")
+    return 0
+
+
 def main(argv: List[str]) -> int:
     if not argv:
         print(__doc__)
@@ -94,6 +235,8 @@ def main(argv: List[str]) -> int:
         return cmd_status(args)
     if cmd == "snapshot":
         return cmd_snapshot(args)
+    if cmd == "build":
+        return cmd_build(args)
     print(f"Unknown command: {cmd}", file=sys.stderr)
     print(__doc__)
     return 1
@@ -7,14 +7,163 @@ import subprocess
 import json
 import time
 import os
+import itertools
+import logging
+import queue
+import random
+import sched
 import sys
-from pathlib import Path
 from typing import Dict, List, Optional
 import threading
-import queue
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    from github_manager import GitHubManager
+except ImportError as e:  # requests is missing
+    GitHubManager = None
+    _github_import_error = e
+
+# Threads only enqueue log records; one listener thread writes them to stdout
+log = logging.getLogger('enhanced_autonomous_team')
+log.setLevel(logging.INFO)
+log.propagate = False
+_logq = queue.SimpleQueue()
+log.addHandler(QueueHandler(_logq))
+_listener = None
+_listener_users = 0  # teams that have started and not yet cleaned up
+_listener_lock = threading.Lock()
+
+def _start_logging():
+    """Start the stdout listener if it is not already running."""
+    global _listener, _listener_users
+    with _listener_lock:
+        _listener_users += 1
+        if _listener is None:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            _listener = QueueListener(_logq, handler)
+            _listener.start()
+
+def _stop_logging():
+    """Flush pending records and stop the listener once its last user is done."""
+    global _listener, _listener_users
+    with _listener_lock:
+        if _listener_users == 0:
+            return
+        _listener_users -= 1
+        if _listener_users == 0 and _listener is not None:
+            _listener.stop()
+            _listener = None
+
+class _WorkStealingPool:
+    """Fixed worker pool with one deque per worker.
+
+    Tasks are dealt round-robin onto the workers' deques.  A worker pops
+    its own deque from the right; when it runs dry it steals half of a
+    random victim's deque from the left, and sleeps on a condition that
+    submit() signals if there was nothing to steal.  Only the owner and an
+    occasional thief ever contend for a given deque's lock; the condition
+    is only taken to submit, to shut down or by a worker going idle.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str = 'worker'):
+        self._deques = [deque() for _ in range(max_workers)]
+        self._locks = [threading.Lock() for _ in range(max_workers)]
+        self._next = itertools.count()
+        self._idle = threading.Condition()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._work, args=(i,), name=f'{thread_name_prefix}_{i}', daemon=True)
+            for i in range(max_workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args) -> Future:
+        """Queue fn(*args) and return a Future for its result."""
+        future = Future()
+        # Checked and queued under the condition shutdown() takes, so a task
+        # can never land after the workers have decided to exit
+        with self._idle:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new tasks after shutdown')
+            i = next(self._next) % len(self._deques)
+            with self._locks[i]:
+                self._deques[i].append((future, fn, args))
+            self._idle.notify()
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False):
+        """Stop the workers once the queued tasks are done (or cancelled)."""
+        with self._idle:
+            if cancel_futures:
+                for lock, tasks in zip(self._locks, self._deques):
+                    with lock:
+                        while tasks:
+                            tasks.popleft()[0].cancel()
+            self._shutdown = True
+            self._idle.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _pop(self, i: int):
+        with self._locks[i]:
+            return self._deques[i].pop() if self._deques[i] else None
+
+    def _steal(self, i: int):
+        if len(self._deques) < 2:
+            return None
+        victim = random.randrange(len(self._deques) - 1)
+        if victim >= i:
+            victim += 1
+        with self._locks[victim]:
+            tasks = self._deques[victim]
+            stolen = [tasks.popleft() for _ in range(max(1, len(tasks) // 2)) if tasks]
+        if not stolen:
+            return None
+        if len(stolen) > 1:
+            with self._locks[i]:
+                self._deques[i].extend(stolen[1:])
+        return stolen[0]
+
+    def _work(self, i: int):
+        while True:
+            item = self._pop(i) or self._steal(i)
+            if item is None:
+                # submit() queues under this condition, so nothing can arrive
+                # between the check and the wait
+                with self._idle:
+                    if not any(self._deques):
+                        if self._shutdown:
+                            return
+                        self._idle.wait()
+                continue
+            future, fn, args = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
 
 class EnhancedAutonomousTeam:
+    # Task type -> handler method; add more task types as needed
+    _HANDLERS = {
+        'code_review': 'review_code',
+        'testing': 'run_tests',
+        'deployment': 'deploy_changes',
+        'github_sync': 'sync_with_github',
+        'monitoring': 'monitor_repositories',
+        'development': 'handle_development_task',
+    }
+
+    # Repos start() keeps a status.log in; created (and git-initialised) if missing
+    STATUS_REPOS = ('~/InsightFactory', '~/Downloads/Tmux-Orchestrator-modified')
+
     def add_development_task(self, description: str, repo_path: str):
         """Queue a new development task for the team."""
         self.add_task({
@@ -22,31 +171,67 @@ class EnhancedAutonomousTeam:
             'description': description,
             'repo_path': repo_path
         })
+    def _reschedule(self, delay: float, fn, *args):
+        """Run fn(*args) after delay seconds, then every delay seconds after that."""
+        def run():
+            try:
+                fn(*args)
+            except Exception as e:
+                log.error(f"❌ Scheduled {fn.__name__} failed: {e}")
+            # A job that was running when stop() cancelled the queue must not re-arm itself
+            if not self._stop.is_set():
+                self._reschedule(delay, fn, *args)
+        self._sched.enter(delay, 1, run)
+
+    def _cancel_scheduled(self):
+        """Drop every recurring job that is still waiting to run."""
+        for event in self._sched.queue:
+            try:
+                self._sched.cancel(event)
+            except ValueError:  # it ran in the meantime
+                pass
+
     def start_periodic_updates(self, repo_path: str, interval: int = 600):
-        """Periodically update status.log and sync to GitHub."""
-        def periodic():
-            while True:
+        """Register repo_path for a status.log update and GitHub sync every interval seconds."""
+        self._periodic_repos.append((repo_path, interval))
+        self._periodic_due[repo_path] = time.monotonic() + interval
+
+    def _run_periodic_updates(self):
+        """Single updater tick covering every registered repo that is due."""
+        now = time.monotonic()
+        for repo_path, interval in self._periodic_repos:
+            if now < self._periodic_due[repo_path]:
+                continue
+            self._periodic_due[repo_path] = now + interval
+            try:
                 self.update_status_log(repo_path, "Periodic update from autonomous team.")
-                time.sleep(interval)
-        thread = threading.Thread(target=periodic, daemon=True)
-        thread.start()
+            except Exception as e:
+                log.error(f"❌ Periodic update failed for {repo_path}: {e}")
 
     def update_status_log(self, repo_path: str, message: str):
         """Create or update a status.log file in the repo."""
-        # Ensure directory exists
-        if not os.path.exists(repo_path):
-            os.makedirs(repo_path)
-        # Ensure it's a git repo
-        if not os.path.exists(os.path.join(repo_path, '.git')):
-            print(f"⚠️ Initializing git repository in {repo_path}")
-            subprocess.run(['git', 'init'], cwd=repo_path)
-        log_path = os.path.join(repo_path, "status.log")
-        with open(log_path, "a") as f:
-            f.write(f"[{datetime.now().isoformat()}] {message}\n")
-        print(f"📝 Updated status.log in {repo_path}")
+        if repo_path not in self._initialized_repos:
+            # Ensure directory exists
+            if not os.path.exists(repo_path):
+                os.makedirs(repo_path)
+            # Ensure it's a git repo
+            if not os.path.exists(os.path.join(repo_path, '.git')):
+                log.warning(f"⚠️ Initializing git repository in {repo_path}")
+                subprocess.run(['git', 'init'], cwd=repo_path)
+            self._initialized_repos.add(repo_path)
+        fd = self._log_fds.get(repo_path)
+        if fd is None:
+            fd = self._log_fds[repo_path] = os.open(
+                os.path.join(repo_path, "status.log"), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+            )
+        # One append-mode write(2) per line, so concurrent writers never interleave
+        os.write(fd, f"[{datetime.now().isoformat()}] {message}\n".encode())
+        log.info(f"📝 Updated status.log in {repo_path}")
         # Queue a sync task with absolute repo path
         self.add_task({'type': 'github_sync', 'repo_path': repo_path})
     def __init__(self, base_config: dict = None):
+        _start_logging()
+        self._logging = True  # holds one reference on the shared listener until cleanup()
         self.base_config = base_config or {}
         self.session_name = self.base_config.get('session_name', 'enhanced-dev-team')
         self.performance_metrics = {
@@ -54,41 +239,32 @@ class EnhancedAutonomousTeam:
             'tasks_failed': 0,
             'optimization_cycles': 0
         }
-        self.task_queue = queue.Queue()
-        self.worker_threads = []
-        self.monitoring_thread = None
-        self.optimization_thread = None
-        # Import GitHubManager from orchestrator
-        sys.path.append(str(Path(__file__).parent))
-        try:
-            from github_manager import GitHubManager
-            token = os.getenv('GITHUB_TOKEN')
-            self.github_manager = GitHubManager(".", token)  # Initialize with current directory and token
-            print("✅ GitHub manager initialized successfully")
-        except Exception as e:
-            print(f"⚠️ Could not import GitHubManager: {e}")
+        self._metrics_lock = threading.Lock()  # guards the counter increments only
+        self.executor = _WorkStealingPool(
+            max_workers=self.base_config.get('max_workers', 8),
+            thread_name_prefix='team'
+        )
+        self._futures = deque()  # submitted tasks, oldest first
+        self._futures_lock = threading.Lock()  # add_task runs on pool threads too
+        # Repos already checked by update_status_log, and their status.log descriptors
+        self._initialized_repos = set()
+        self._log_fds = {}
+        self._stop = threading.Event()  # set by stop() to end start()
+        # Every recurring job shares one timer heap and one dispatcher thread;
+        # it sleeps on _stop so that stopping wakes it straight away
+        self._sched = sched.scheduler(time.monotonic, self._stop.wait)
+        self._sched_thread = None
+        # Repos refreshed by the periodic updater, and when each is next due
+        self._periodic_repos = []
+        self._periodic_due = {}
+        if GitHubManager:
+            # Initialize with current directory and token
+            self.github_manager = GitHubManager(".", os.getenv('GITHUB_TOKEN'))
+            log.info("✅ GitHub manager initialized successfully")
+        else:
+            log.warning(f"⚠️ Could not import GitHubManager: {_github_import_error}")
             self.github_manager = None
 
-    def start_monitoring(self):
-        """Start the monitoring thread."""
-        def monitor():
-            while True:
-                self.analyze_performance()
-                time.sleep(300)  # Check every 5 minutes
-
-        self.monitoring_thread = threading.Thread(target=monitor, daemon=True)
-        self.monitoring_thread.start()
-
-    def start_optimization(self):
-        """Start the optimization thread."""
-        def optimize():
-            while True:
-                self.optimize_performance()
-                time.sleep(3600)  # Optimize every hour
-
-        self.optimization_thread = threading.Thread(target=optimize, daemon=True)
-        self.optimization_thread.start()
-
     def analyze_performance(self):
         """Analyze team performance and suggest improvements."""
         total_tasks = self.performance_metrics['tasks_completed'] + self.performance_metrics['tasks_failed']
@@ -96,94 +272,63 @@ class EnhancedAutonomousTeam:
             return
 
         success_rate = (self.performance_metrics['tasks_completed'] / total_tasks) * 100
-        print(f"\n🔍 Performance Analysis ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
-        print(f"Success Rate: {success_rate:.2f}%")
-        print(f"Tasks Completed: {self.performance_metrics['tasks_completed']}")
-        print(f"Tasks Failed: {self.performance_metrics['tasks_failed']}")
-        print(f"Optimization Cycles: {self.performance_metrics['optimization_cycles']}")
+        log.info(f"\n🔍 Performance Analysis ({datetime.now().strftime('%Y-%m-%d %H:%M:%S')})")
+        log.info(f"Success Rate: {success_rate:.2f}%")
+        log.info(f"Tasks Completed: {self.performance_metrics['tasks_completed']}")
+        log.info(f"Tasks Failed: {self.performance_metrics['tasks_failed']}")
+        log.info(f"Optimization Cycles: {self.performance_metrics['optimization_cycles']}")
 
         if success_rate < 90:
-            print("⚠️ Performance below target. Triggering optimization...")
+            log.warning("⚠️ Performance below target. Triggering optimization...")
             self.optimize_performance()
 
     def optimize_performance(self):
         """Implement performance optimizations."""
-        print("\n🔄 Running optimization cycle...")
-        
-        # Scale workers based on task queue size
-        queue_size = self.task_queue.qsize()
-        current_workers = len(self.worker_threads)
+        log.info("\n🔄 Running optimization cycle...")
         
-        if queue_size > current_workers * 2:
-            self.scale_up()
-        elif queue_size < current_workers / 2:
-            self.scale_down()
+        # The pool's workers balance the load between themselves; just report
+        # the backlog so it shows up alongside the other metrics
+        with self._futures_lock:
+            self._prune_futures()
+            pending = sum(1 for future in self._futures if not future.done())
+        log.info(f"📊 Pending tasks: {pending}")
 
         # Implement other optimizations
-        self.performance_metrics['optimization_cycles'] += 1
-
-    def scale_up(self):
-        """Add more worker threads."""
-        new_workers = min(5, self.task_queue.qsize())  # Add up to 5 workers at once
-        print(f"📈 Scaling up: Adding {new_workers} workers...")
-        for _ in range(new_workers):
-            self.add_worker()
-
-    def scale_down(self):
-        """Remove excess worker threads."""
-        excess = len(self.worker_threads) - max(1, self.task_queue.qsize())
-        if excess > 0:
-            print(f"📉 Scaling down: Removing {excess} workers...")
-            for _ in range(excess):
-                if self.worker_threads:
-                    worker = self.worker_threads.pop()
-                    # Signal worker to stop
-                    self.task_queue.put(None)
-
-    def add_worker(self):
-        """Add a new worker thread."""
-        def worker():
-            while True:
-                task = self.task_queue.get()
-                if task is None:  # Stop signal
-                    break
-                try:
-                    self.execute_task(task)
-                    self.performance_metrics['tasks_completed'] += 1
-                except Exception as e:
-                    print(f"❌ Task failed: {str(e)}")
-                    self.performance_metrics['tasks_failed'] += 1
-                finally:
-                    self.task_queue.task_done()
-
-        thread = threading.Thread(target=worker, daemon=True)
-        thread.start()
-        self.worker_threads.append(thread)
+        self._bump('optimization_cycles')
+
+    def _prune_futures(self):
+        """Forget tasks that have finished, oldest first; hold _futures_lock."""
+        while self._futures and self._futures[0].done():
+            self._futures.popleft()
+
+    def _bump(self, metric: str):
+        """Increment a performance counter; += on a dict item is not atomic across threads."""
+        with self._metrics_lock:
+            self.performance_metrics[metric] += 1
+
+    def _run_task(self, task: Dict):
+        """Execute a task on an executor thread and record the outcome."""
+        try:
+            self.execute_task(task)
+            self._bump('tasks_completed')
+        except Exception as e:
+            log.error(f"❌ Task failed: {str(e)}")
+            self._bump('tasks_failed')
 
     def execute_task(self, task: Dict):
         """Execute a development task."""
         task_type = task.get('type')
-        print(f"📋 Executing task: {task_type}")
+        log.info(f"📋 Executing task: {task_type}")
         
-        if task_type == 'code_review':
-            self.review_code(task)
-        elif task_type == 'testing':
-            self.run_tests(task)
-        elif task_type == 'deployment':
-            self.deploy_changes(task)
-        elif task_type == 'github_sync':
-            self.sync_with_github(task)
-        elif task_type == 'monitoring':
-            self.monitor_repositories(task)
-        elif task_type == 'development':
-            self.handle_development_task(task)
-        # Add more task types as needed
+        handler = getattr(self, self._HANDLERS.get(task_type, ''), None)
+        if handler:
+            handler(task)
 
     def handle_development_task(self, task: Dict):
         """Handle a development task."""
         description = task.get('description')
         repo_path = task.get('repo_path')
-        print(f"🛠️ Working on development task: {description} in {repo_path}")
+        log.info(f"🛠️ Working on development task: {description} in {repo_path}")
         # Here, you can implement logic to call AI agents, refactor code, or run scripts
         # For now, just log the action
         
@@ -191,80 +336,91 @@ class EnhancedAutonomousTeam:
         """Perform automated code review."""
         repo = task.get('repo')
         pr_number = task.get('pr_number')
-        print(f"🔍 Reviewing code for PR #{pr_number} in {repo}")
+        log.info(f"🔍 Reviewing code for PR #{pr_number} in {repo}")
         # Implement code review logic
         
     def run_tests(self, task: Dict):
         """Run automated tests."""
         repo = task.get('repo')
         test_path = task.get('test_path')
-        print(f"🧪 Running tests in {repo}: {test_path}")
+        log.info(f"🧪 Running tests in {repo}: {test_path}")
         # Implement test execution logic
         
     def deploy_changes(self, task: Dict):
         """Deploy code changes."""
         repo = task.get('repo')
         environment = task.get('environment', 'development')
-        print(f"🚀 Deploying {repo} to {environment}")
+        log.info(f"🚀 Deploying {repo} to {environment}")
         # Implement deployment logic
         
     def sync_with_github(self, task: Dict):
         """Synchronize with GitHub repository."""
         repo_path = task.get('repo_path')
         remote_url = task.get('remote_url')
-        print(f"🔄 Syncing with GitHub repo: {repo_path}")
+        log.info(f"🔄 Syncing with GitHub repo: {repo_path}")
         if self.github_manager and repo_path:
-            commit_message = f"Automated sync by EnhancedAutonomousTeam at {datetime.now().isoformat()}"
+            commit_message = f"Automated sync by EnhancedAutonomousTeam at {datetime.now().isoformat(timespec='seconds')}"
             try:
-                # Check if remote is set
-                result = subprocess.run(['git', 'remote'], cwd=repo_path, capture_output=True, text=True)
-                if 'origin' not in result.stdout and remote_url:
-                    print(f"🔗 Adding remote origin: {remote_url}")
-                    subprocess.run(['git', 'remote', 'add', 'origin', remote_url], cwd=repo_path)
-                self.github_manager.push_changes(repo_path, commit_message)
-                # Push to remote
-                subprocess.run(['git', 'push', '-u', 'origin', 'main'], cwd=repo_path)
-                print(f"✅ Synced {repo_path} to GitHub.")
+                # push_changes adds origin from remote_url when it is missing, then pushes
+                self.github_manager.push_changes(repo_path, commit_message, remote_url)
+                log.info(f"✅ Synced {repo_path} to GitHub.")
             except Exception as e:
-                print(f"❌ Failed to sync {repo_path}: {e}")
+                log.error(f"❌ Failed to sync {repo_path}: {e}")
         else:
-            print("⚠️ GitHubManager not available or repo_path missing. Skipping sync.")
+            log.warning("⚠️ GitHubManager not available or repo_path missing. Skipping sync.")
         
     def monitor_repositories(self, task: Dict):
         """Monitor repository activities."""
         repos = task.get('repos', [])
-        print(f"👀 Monitoring repositories: {repos}")
+        log.info(f"👀 Monitoring repositories: {repos}")
         # Implement repository monitoring logic
 
     def add_task(self, task: Dict):
-        """Add a task to the queue."""
-        self.task_queue.put(task)
-        print(f"📋 Task added: {task.get('type')}")
+        """Submit a task to the worker pool."""
+        with self._futures_lock:
+            self._prune_futures()
+            self._futures.append(self.executor.submit(self._run_task, task))
+        log.info(f"📋 Task added: {task.get('type')}")
         
     def cleanup(self):
         """Clean up threads before shutdown."""
-        print("\n🧹 Cleaning up threads...")
-        # Signal all workers to stop
-        for _ in self.worker_threads:
-            self.task_queue.put(None)
-        # Wait for all workers to finish
-        for thread in self.worker_threads:
-            thread.join(timeout=1)
-        print("✅ Cleanup complete")
+        log.info("\n🧹 Cleaning up threads...")
+        # No scheduled job may submit a task or write a status.log past this point
+        self._stop.set()
+        self._cancel_scheduled()
+        if self._sched_thread is not None:
+            self._sched_thread.join()
+            self._sched_thread = None
+        # Finish running tasks and drop the ones that have not started
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        if self.github_manager:
+            self.github_manager.close()
+        for fd in self._log_fds.values():
+            os.close(fd)
+        self._log_fds.clear()
+        log.info("✅ Cleanup complete")
+        if self._logging:
+            self._logging = False
+            _stop_logging()
 
     def start(self):
         """Start the enhanced autonomous team."""
-        print("🚀 Starting Enhanced Autonomous Dev Team...")
-        self.add_worker()  # Start with one worker
-        self.start_monitoring()
-        self.start_optimization()
+        log.info("🚀 Starting Enhanced Autonomous Dev Team...")
+        self._reschedule(300, self.analyze_performance)  # Check every 5 minutes
+        self._reschedule(3600, self.optimize_performance)  # Optimize every hour
         
         try:
             # Update status.log in both repos and queue sync
-            repo_dirs = [os.path.expanduser('~/InsightFactory'), os.path.expanduser('~/Downloads/Tmux-Orchestrator-modified')]
+            repo_dirs = [os.path.expanduser(repo_dir) for repo_dir in self.STATUS_REPOS]
+            # The first update may create the repo and run git init; do them side by side
+            with ThreadPoolExecutor(max_workers=len(repo_dirs)) as ex:
+                list(ex.map(lambda repo_dir: self.update_status_log(repo_dir, "Autonomous team running and scaling!"), repo_dirs))
             for repo_dir in repo_dirs:
-                self.update_status_log(repo_dir, "Autonomous team running and scaling!")
                 self.start_periodic_updates(repo_dir, interval=600)
+            self._reschedule(min(interval for _, interval in self._periodic_repos), self._run_periodic_updates)
+
+            self._sched_thread = threading.Thread(target=self._sched.run, name='team-sched', daemon=True)
+            self._sched_thread.start()
 
             # Add initial monitoring tasks
             initial_tasks = [
@@ -276,15 +432,20 @@ class EnhancedAutonomousTeam:
             for task in initial_tasks:
                 self.add_task(task)
 
-            print("✅ Team is running and will auto-scale based on workload.")
+            log.info("✅ Team is running and will auto-scale based on workload.")
 
-            # Keep the main thread alive
-            while True:
-                time.sleep(1)
+            # Keep the main thread parked until Ctrl-C or stop()
+            self._stop.wait()
         except KeyboardInterrupt:
-            print("\n⚠️ Received shutdown signal...")
+            log.warning("\n⚠️ Received shutdown signal...")
             self.cleanup()
             sys.exit(0)
+        self.cleanup()
+
+    def stop(self):
+        """Make start() return, cleaning up on the way out."""
+        self._stop.set()
+        self._cancel_scheduled()
 
 if __name__ == "__main__":
     team = EnhancedAutonomousTeam()
@@ -1,204 +1,110 @@
 #!/usr/bin/env python3
 """
 Enhanced Autonomous Dev Team Launcher
-Uses team_config.py to create customized development teams
+Uses team_config.py (settings in team_config.toml) to create customized development teams
 """
 
+import hashlib
+import string
 import subprocess
 import json
 import time
 import os
+import shlex
+import shutil
 import sys
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
-# Import configuration
+# Import configuration; sections are read through the module on each use so
+# that team_config builds them lazily and picks up edits to team_config.toml
 try:
-    from team_config import PROJECTS, TEAM_CONFIG, ROLE_DEFINITIONS, DEV_STANDARDS
-except ImportError:
-    print("❌ Error: team_config.py not found. Please ensure it's in the same directory.")
+    import team_config
+except ImportError as e:
+    print(f"❌ Error loading team configuration: {e}")
+    print("   Please ensure team_config.py and team_config.toml are in the same directory.")
     sys.exit(1)
 
-class EnhancedAutonomousTeam:
-    def __init__(self):
-        self.base_dir = TEAM_CONFIG["base_dir"]
-        self.session_name = TEAM_CONFIG["session_name"]
-        self.projects = {}
-        self.active_windows = 0
-        
-    def check_dependencies(self):
-        """Check if required tools are available"""
-        print("🔍 Checking dependencies...")
-        
-        dependencies = ["tmux", "git", "python3"]
-        missing = []
-        
-        for dep in dependencies:
-            if subprocess.run(["which", dep], capture_output=True).returncode != 0:
-                missing.append(dep)
-        
-        if missing:
-            print(f"❌ Missing dependencies: {', '.join(missing)}")
-            print("Please install them and try again.")
-            return False
-            
-        print("✅ All dependencies available")
-        return True
-    
-    def create_project_directories(self):
-        """Create project directories if they don't exist"""
-        print("📁 Setting up project directories...")
-        
-        for project in PROJECTS:
-            repo_path = Path(project["repo_path"])
-            if not repo_path.exists():
-                print(f"   Creating: {repo_path}")
-                repo_path.mkdir(parents=True, exist_ok=True)
-                
-                # Initialize git repo if needed
-                if not (repo_path / ".git").exists():
-                    subprocess.run(["git", "init"], cwd=repo_path, check=True)
-                    
-                    # Create basic project structure
-                    self._create_project_structure(repo_path, project)
-        
-        print("✅ Project directories ready")
-    
-    def _create_project_structure(self, repo_path: Path, project: dict):
-        """Create basic project structure based on project type"""
-        project_type = project["type"].lower()
-        
-        # Create README
-        readme_content = f"""# {project['name']}
+# Text shown by Claude once it is ready to accept a prompt
+CLAUDE_READY_MARKERS = ("? for shortcuts", "│ >")
+CLAUDE_READY_TIMEOUT = 5.0  # seconds
 
-**Type**: {project['type']}
-**Status**: In Development (Autonomous AI Team)
+# Team events reported to the monitor. tmux runs window-linked from the
+# session's own hooks, but window-unlinked and session-closed only from the
+# global ones, so those are guarded to act for the team session alone
+SESSION_EVENT_HOOKS = ("window-linked",)
+GLOBAL_EVENT_HOOKS = ("window-unlinked", "session-closed")
 
-## Requirements
-{chr(10).join([f"- {req}" for req in project['requirements']])}
+# Roles staffed when a project does not list its own team_roles
+DEFAULT_TEAM_ROLES = ["frontend", "backend", "devops", "qa"]
 
-## Team
-This project is being developed by an autonomous AI development team:
-- Project Manager: Coordinates development and ensures requirements are met
-- Engineers: Implement features based on specialization
-- QA: Ensures quality and testing standards
-- DevOps: Handles deployment and infrastructure
+# Leaf directories created for each kind of project; parents come for free
+STRUCTURE = {
+    "website": ["src/components", "src/styles", "public", "docs", "tests", ".github/workflows"],
+    "api": ["src", "tests", "docs", ".github/workflows"],
+    "mobile": ["src", "assets", "tests", "docs", ".github/workflows"],
+    "default": ["docs", "tests", ".github/workflows"],
+}
 
-## Development
-The team follows these standards:
-- Commits every {DEV_STANDARDS['commit_frequency']} minutes
-- Code review required: {DEV_STANDARDS['code_review_required']}
-- Testing required: {DEV_STANDARDS['testing_required']}
+def _events_fifo(session_name: str) -> str:
+    """Per-user, per-session FIFO the tmux hooks write team events to"""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, f"{session_name}-events.fifo")
+    return os.path.join(tempfile.gettempdir(), f"{session_name}-{os.getuid()}-events.fifo")
 
-Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}
-"""
-        (repo_path / "README.md").write_text(readme_content)
-        
-        # Create basic structure based on project type
-        if "website" in project_type or "frontend" in project_type:
-            (repo_path / "src").mkdir(exist_ok=True)
-            (repo_path / "public").mkdir(exist_ok=True)
-            (repo_path / "src" / "components").mkdir(exist_ok=True)
-            (repo_path / "src" / "styles").mkdir(exist_ok=True)
-            
-        elif "api" in project_type or "backend" in project_type:
-            (repo_path / "src").mkdir(exist_ok=True)
-            (repo_path / "tests").mkdir(exist_ok=True)
-            (repo_path / "docs").mkdir(exist_ok=True)
-            
-        elif "mobile" in project_type:
-            (repo_path / "src").mkdir(exist_ok=True)
-            (repo_path / "assets").mkdir(exist_ok=True)
-            (repo_path / "tests").mkdir(exist_ok=True)
-        
-        # Always create these
-        (repo_path / "docs").mkdir(exist_ok=True)
-        (repo_path / "tests").mkdir(exist_ok=True)
-        (repo_path / ".github" / "workflows").mkdir(parents=True, exist_ok=True)
-        
-        # Initial commit
-        subprocess.run(["git", "add", "."], cwd=repo_path, check=True)
-        subprocess.run(["git", "commit", "-m", "Initial project setup by AI team"], cwd=repo_path, check=True)
-    
-    def create_orchestrator(self):
-        """Create master orchestrator"""
-        print("🎯 Creating Master Orchestrator...")
-        
-        # Create session
-        cmd = ["tmux", "new-session", "-d", "-s", self.session_name]
-        subprocess.run(cmd, check=True)
-        
-        # Rename window
-        subprocess.run(["tmux", "rename-window", "-t", f"{self.session_name}:0", "Orchestrator"], check=True)
-        
-        # Send orchestrator prompt
-        orchestrator_prompt = self._get_enhanced_orchestrator_prompt()
-        self._send_message_to_window(f"{self.session_name}:0", orchestrator_prompt)
-        
-        self.active_windows = 1
-        print("✅ Master Orchestrator online")
-    
-    def setup_projects(self):
-        """Set up all projects from configuration"""
-        print(f"🏗️  Setting up {len(PROJECTS)} projects...")
-        
-        for project in PROJECTS:
-            self.setup_single_project(project)
-            time.sleep(2)  # Small delay between project setups
-    
-    def setup_single_project(self, project: dict):
-        """Set up a single project with its team"""
-        project_name = project["name"]
-        print(f"   📋 Setting up {project_name}...")
-        
-        # Create PM window
-        pm_window_num = self.active_windows
-        pm_window = f"{self.session_name}:{pm_window_num}"
-        subprocess.run(["tmux", "new-window", "-t", self.session_name, "-n", f"PM-{project_name}"], check=True)
-        
-        # Create developer windows based on project team roles
-        dev_windows = {}
-        for role in project.get("team_roles", ["frontend", "backend", "devops", "qa"]):
-            self.active_windows += 1
-            dev_window_num = self.active_windows
-            dev_window = f"{self.session_name}:{dev_window_num}"
-            window_name = f"{ROLE_DEFINITIONS[role]['title'].replace(' ', '')}-{project_name}"
-            subprocess.run(["tmux", "new-window", "-t", self.session_name, "-n", window_name], check=True)
-            dev_windows[role] = dev_window
-        
-        # Store project info
-        self.projects[project_name] = {
-            **project,
-            "pm_window": pm_window,
-            "dev_windows": dev_windows,
-            "pm_window_num": pm_window_num
-        }
-        
-        # Initialize PM
-        pm_prompt = self._get_enhanced_pm_prompt(project, dev_windows)
-        self._send_message_to_window(pm_window, pm_prompt)
-        
-        # Initialize developers
-        for role, window in dev_windows.items():
-            dev_prompt = self._get_enhanced_developer_prompt(role, project)
-            self._send_message_to_window(window, dev_prompt)
-        
-        self.active_windows += 1  # Account for PM window
-        print(f"      ✅ {project_name} team ready ({len(dev_windows) + 1} agents)")
-    
-    def _get_enhanced_orchestrator_prompt(self) -> str:
-        return f"""🎯 MASTER ORCHESTRATOR INITIALIZATION
+def _tmux_quote(arg: str) -> str:
+    """Quote one argument for a tmux command line; a bare ";" stays a separator"""
+    if arg == ";":
+        return arg
+    for char, escaped in (("\\", "\\\\"), ('"', '\\"'), ("$", "\\$"), ("\n", "\\n")):
+        arg = arg.replace(char, escaped)
+    return f'"{arg}"'
+
+# role -> (definition it was built from, fragments); rebuilt once team_config reloads
+_ROLE_FRAGMENTS: Dict[str, Tuple[object, Dict[str, str]]] = {}
+
+def _role_fragments(role: str) -> Dict[str, str]:
+    """Title variants and prompt fragments for a role, built once and shared by every project"""
+    role_info = team_config.ROLE_DEFINITIONS[role]
+    cached = _ROLE_FRAGMENTS.get(role)
+    if cached is not None and cached[0] is role_info:
+        return cached[1]
+    fragments = {
+        "title": role_info['title'],
+        "title_upper": role_info['title'].upper(),
+        "title_nospace": role_info['title'].replace(' ', ''),
+        "specializations": "\n".join(f"• {spec}" for spec in role_info['specializations']),
+        "tools": "\n".join(f"• {tool}" for tool in role_info['tools']),
+        "focus": ', '.join(role_info['specializations'][:2]),
+    }
+    _ROLE_FRAGMENTS[role] = (role_info, fragments)
+    return fragments
+
+# Project type keywords, checked in order, and the STRUCTURE entry they select
+STRUCTURE_KEYWORDS = [
+    ("website", "website"), ("frontend", "website"),
+    ("api", "api"), ("backend", "api"),
+    ("mobile", "mobile"),
+]
+
+# Agent prompts.  Fields that never change for a launcher instance are bound
+# in __init__; the rest are filled in per agent.
+_ORCHESTRATOR_TEMPLATE = string.Template("""🎯 MASTER ORCHESTRATOR INITIALIZATION
 
 You are the Master Orchestrator for an autonomous development organization.
 
 CONFIGURATION:
-- Session: {self.session_name}
-- Projects: {len(PROJECTS)} active projects
-- Total Team Size: {sum(len(p.get('team_roles', [])) + 1 for p in PROJECTS)} agents
-- Check-in Frequency: Every {TEAM_CONFIG['orchestrator_checkin']} minutes
+- Session: $session_name
+- Projects: $project_count active projects
+- Total Team Size: $team_size agents
+- Check-in Frequency: Every $orchestrator_checkin minutes
 
 YOUR PROJECTS:
-{chr(10).join([f"- {p['name']}: {p['type']} (Priority: {p.get('priority', 'normal')})" for p in PROJECTS])}
+$project_list
 
 RESPONSIBILITIES:
 1. 🎛️  Strategic oversight across all projects
@@ -209,17 +115,17 @@ RESPONSIBILITIES:
 6. 🤖 Team health monitoring and optimization
 
 AUTONOMOUS CAPABILITIES:
-- Self-schedule check-ins every {TEAM_CONFIG['orchestrator_checkin']} minutes
+- Self-schedule check-ins every $orchestrator_checkin minutes
 - Monitor project health and intervene when needed
 - Coordinate cross-project dependencies automatically
 - Escalate to human when critical decisions needed
 - Optimize team performance based on metrics
 
 AVAILABLE COMMANDS:
-- `python3 {self.base_dir}/claude_control.py status` - Get team status
-- `python3 {self.base_dir}/claude_control.py snapshot` - Detailed monitoring
-- `{self.base_dir}/schedule_with_note.sh <min> "<note>"` - Schedule check-ins
-- `{self.base_dir}/send-claude-message.sh <window> "<msg>"` - Send messages
+- `python3 $base_dir/claude_control.py status` - Get team status
+- `python3 $base_dir/claude_control.py snapshot` - Detailed monitoring
+- `$base_dir/schedule_with_note.sh <min> "<note>"` - Schedule check-ins
+- `$base_dir/send-claude-message.sh <window> "<msg>"` - Send messages
 
 IMMEDIATE ACTIONS:
 1. Acknowledge your role as Master Orchestrator
@@ -227,29 +133,23 @@ IMMEDIATE ACTIONS:
 3. Set up your first automated check-in schedule
 4. Begin strategic oversight of development progress
 
-🚀 INITIATE AUTONOMOUS ORCHESTRATION MODE"""
+🚀 INITIATE AUTONOMOUS ORCHESTRATION MODE""")
 
-    def _get_enhanced_pm_prompt(self, project: dict, dev_windows: dict) -> str:
-        team_list = chr(10).join([
-            f"- {ROLE_DEFINITIONS[role]['title']}: {window} (Specializes in {', '.join(ROLE_DEFINITIONS[role]['specializations'][:2])})" 
-            for role, window in dev_windows.items()
-        ])
-        
-        return f"""📋 PROJECT MANAGER INITIALIZATION
+_PM_TEMPLATE = string.Template("""📋 PROJECT MANAGER INITIALIZATION
 
-You are the Project Manager for {project['name']}.
+You are the Project Manager for $project_name.
 
 PROJECT OVERVIEW:
-- Name: {project['name']}
-- Type: {project['type']}
-- Repository: {project['repo_path']}
-- Priority: {project.get('priority', 'normal').upper()}
+- Name: $project_name
+- Type: $project_type
+- Repository: $repo_path
+- Priority: $priority
 
 REQUIREMENTS TO DELIVER:
-{chr(10).join([f"{i+1}. {req}" for i, req in enumerate(project['requirements'])])}
+$requirements
 
 YOUR DEVELOPMENT TEAM:
-{team_list}
+$team_list
 
 MANAGEMENT RESPONSIBILITIES:
 1. 📋 Break down requirements into specific, actionable tasks
@@ -260,47 +160,48 @@ MANAGEMENT RESPONSIBILITIES:
 6. 📊 Report progress to Master Orchestrator regularly
 
 AUTONOMOUS BEHAVIORS:
-- Check team progress every {TEAM_CONFIG['pm_checkin']} minutes
+- Check team progress every $pm_checkin minutes
 - Automatically reassign tasks if developers are blocked
-- Enforce git discipline (commits every {DEV_STANDARDS['commit_frequency']} minutes)
+- Enforce git discipline (commits every $commit_frequency minutes)
 - Request code reviews before merging
 - Escalate to Orchestrator if project timeline is at risk
 
 QUALITY STANDARDS:
-- Code review required: {DEV_STANDARDS['code_review_required']}
-- Testing required: {DEV_STANDARDS['testing_required']}
-- Documentation required: {DEV_STANDARDS['documentation_required']}
-- Max work session: {DEV_STANDARDS['max_work_session']} hours
+- Code review required: $code_review_required
+- Testing required: $testing_required
+- Documentation required: $documentation_required
+- Max work session: $max_work_session hours
 
 COMMUNICATION COMMANDS:
-- `{self.base_dir}/send-claude-message.sh <window> "<message>"` - Message team members
-- `{self.base_dir}/schedule_with_note.sh {TEAM_CONFIG['pm_checkin']} "Check {project['name']} progress"` - Schedule check-ins
+- `$base_dir/send-claude-message.sh <window> "<message>"` - Message team members
+- `$base_dir/schedule_with_note.sh $pm_checkin "Check $project_name progress"` - Schedule check-ins
 
 IMMEDIATE ACTIONS:
-1. Acknowledge your role as PM for {project['name']}
+1. Acknowledge your role as PM for $project_name
 2. Analyze requirements and create initial task breakdown
 3. Assign first round of tasks to your development team
 4. Set up your automated progress monitoring schedule
 
-🎯 BEGIN PROJECT MANAGEMENT FOR {project['name'].upper()}"""
+🎯 BEGIN PROJECT MANAGEMENT FOR $project_name_upper""")
 
-    def _get_enhanced_developer_prompt(self, role: str, project: dict) -> str:
-        role_info = ROLE_DEFINITIONS[role]
-        
-        return f"""👨‍💻 {role_info['title'].upper()} INITIALIZATION
+# The developer prompt is head + role block + tail.  The role block names no
+# project, so it is built once per role and handed to tmux as a paste buffer
+_DEV_HEAD_TEMPLATE = string.Template("""👨‍💻 $role_title_upper INITIALIZATION
 
-You are a {role_info['title']} on the {project['name']} project.
+You are a $role_title on the $project_name project.
 
 PROJECT CONTEXT:
-- Project: {project['name']} ({project['type']})
-- Repository: {project['repo_path']}
-- Your Role: {role_info['title']}
+- Project: $project_name ($project_type)
+- Repository: $repo_path
+""")
+
+_DEV_ROLE_TEMPLATE = string.Template("""- Your Role: $role_title
 
 YOUR SPECIALIZATIONS:
-{chr(10).join([f"• {spec}" for spec in role_info['specializations']])}
+$specializations
 
 TOOLS & TECHNOLOGIES:
-{chr(10).join([f"• {tool}" for tool in role_info['tools']])}
+$tools
 
 DEVELOPMENT RESPONSIBILITIES:
 1. 🔨 Implement features assigned by your Project Manager
@@ -313,16 +214,16 @@ DEVELOPMENT RESPONSIBILITIES:
 AUTONOMOUS BEHAVIORS:
 - Work independently on assigned tasks
 - Research solutions when blocked (web search after 10 minutes)
-- Commit progress every {DEV_STANDARDS['commit_frequency']} minutes with descriptive messages
+- Commit progress every $commit_frequency minutes with descriptive messages
 - Request help from PM if blocked for more than 60 minutes
 - Take initiative on improvements and optimizations
 - Suggest better approaches or technologies when appropriate
 
 GIT DISCIPLINE (MANDATORY):
-- `git add -A && git commit -m "feat: <description>"` every {DEV_STANDARDS['commit_frequency']} minutes
+- `git add -A && git commit -m "feat: <description>"` every $commit_frequency minutes
 - Always commit before switching tasks or taking breaks
-- Use conventional commit format: {DEV_STANDARDS['commit_message_format']}
-- Create feature branches: {DEV_STANDARDS['branch_naming']}
+- Use conventional commit format: $commit_message_format
+- Create feature branches: $branch_naming
 - Never leave uncommitted changes
 
 QUALITY STANDARDS:
@@ -339,26 +240,432 @@ COMMUNICATION:
 - Suggest improvements to processes and architecture
 
 IMMEDIATE ACTIONS:
-1. Acknowledge your role as {role_info['title']} for {project['name']}
+1. Acknowledge your role as $role_title for """)
+
+_DEV_TAIL_TEMPLATE = string.Template("""$project_name
 2. Navigate to repository and assess current codebase
 3. Set up your development environment
 4. Wait for task assignment from your Project Manager
 5. Begin autonomous development work
 
-🚀 {role.upper()} ENGINEER READY FOR {project['name'].upper()}"""
+🚀 $role_upper ENGINEER READY FOR $project_name_upper""")
+
+_README_TEMPLATE = string.Template("""# $project_name
+
+**Type**: $project_type
+**Status**: In Development (Autonomous AI Team)
+
+## Requirements
+$requirements
+
+## Team
+This project is being developed by an autonomous AI development team:
+- Project Manager: Coordinates development and ensures requirements are met
+- Engineers: Implement features based on specialization
+- QA: Ensures quality and testing standards
+- DevOps: Handles deployment and infrastructure
+
+## Development
+The team follows these standards:
+- Commits every $commit_frequency minutes
+- Code review required: $code_review_required
+- Testing required: $testing_required
+
+Last updated: $last_updated
+""")
+
+class EnhancedAutonomousTeam:
+    def __init__(self):
+        config, projects = team_config.TEAM_CONFIG, team_config.PROJECTS
+        self.base_dir = config["base_dir"]
+        self.session_name = config["session_name"]
+        self.events_fifo = _events_fifo(self.session_name)
+        self.projects = {}
+        self.active_windows = 0
+        
+        # Control-mode tmux client opened by create_orchestrator; every later
+        # tmux command goes down its pipe instead of starting a new client
+        self._ctl = None
+        self._ctl_lock = threading.Lock()
+        
+        # Bind config constants into the prompt templates once
+        constants = {
+            "session_name": self.session_name,
+            "base_dir": self.base_dir,
+            "orchestrator_checkin": config['orchestrator_checkin'],
+            "pm_checkin": config['pm_checkin'],
+            "project_count": len(projects),
+            "team_size": sum(len(p.get('team_roles', [])) + 1 for p in projects),
+            "project_list": "\n".join(
+                f"- {p['name']}: {p['type']} (Priority: {p.get('priority', 'normal')})" for p in projects
+            ),
+            **{key: team_config.DEV_STANDARDS[key] for key in (
+                "commit_frequency", "code_review_required", "testing_required", "documentation_required",
+                "max_work_session", "commit_message_format", "branch_naming",
+            )},
+        }
+        constants = {key: str(value).replace("$", "$$") for key, value in constants.items()}
+        self._orchestrator_prompt = string.Template(
+            _ORCHESTRATOR_TEMPLATE.safe_substitute(constants)).substitute()
+        self._pm_template = string.Template(_PM_TEMPLATE.safe_substitute(constants))
+        self._readme_template = string.Template(_README_TEMPLATE.safe_substitute(constants))
+        self._role_prompts = {
+            role: string.Template(_DEV_ROLE_TEMPLATE.safe_substitute(constants)).substitute(
+                role_title=_role_fragments(role)['title'],
+                specializations=_role_fragments(role)['specializations'],
+                tools=_role_fragments(role)['tools'],
+            )
+            for role in team_config.ROLE_DEFINITIONS
+        }
+        
+    def _read_tmux_reply(self, blocks: int, command: list) -> str:
+        """Read ``blocks`` replies to our own commands off the control client.
+
+        Notifications and the blocks tmux emits for its own commands (the
+        initial new-session, hooks) are skipped; only an error from one of
+        those is kept, in case the client exits before answering.
+        """
+        output, stray, failed, block, ours = [], [], False, None, False
+        for line in self._ctl.stdout:
+            line = line.rstrip("\n")
+            if block is None:
+                if line.startswith("%begin "):
+                    # The last field is 1 only for commands this client sent
+                    block, ours = [], line.endswith(" 1")
+                continue
+            if line.startswith(("%end ", "%error ")):
+                if ours:
+                    output += block
+                    failed |= line.startswith("%error ")
+                    blocks -= 1
+                elif line.startswith("%error "):
+                    stray += block
+                block = None
+                if not blocks:
+                    break
+                continue
+            block.append(line)
+        else:
+            # The client exited before answering
+            self._ctl.wait()
+            output, failed = stray + output, True
+        if failed:
+            raise subprocess.CalledProcessError(self._ctl.returncode or 1, ["tmux"] + command, "\n".join(output))
+        return "\n".join(output)
+    
+    def _tmux(self, *args: str, check: bool = True) -> str:
+        """Run a tmux command (";" separates chained commands) and return its output"""
+        with self._ctl_lock:
+            self._ctl.stdin.write(" ".join(_tmux_quote(arg) for arg in args) + "\n")
+            self._ctl.stdin.flush()
+            # tmux answers every command of a chain with its own block
+            try:
+                return self._read_tmux_reply(args.count(";") + 1, list(args))
+            except subprocess.CalledProcessError as e:
+                if check:
+                    raise
+                return e.output
+    
+    def close(self):
+        """Detach the control-mode client; the session keeps running"""
+        if self._ctl is not None:
+            self._ctl.stdin.close()
+            self._ctl.wait()
+            self._ctl = None
+    
+    def check_dependencies(self):
+        """Check if required tools are available"""
+        print("🔍 Checking dependencies...")
+        
+        dependencies = ["tmux", "git", "python3"]
+        missing = []
+        
+        for dep in dependencies:
+            if shutil.which(dep) is None:
+                missing.append(dep)
+        
+        if missing:
+            print(f"❌ Missing dependencies: {', '.join(missing)}")
+            print("Please install them and try again.")
+            return False
+            
+        print("✅ All dependencies available")
+        return True
+    
+    def create_project_directories(self):
+        """Create project directories if they don't exist"""
+        print("📁 Setting up project directories...")
+        
+        for project in team_config.PROJECTS:
+            repo_path = Path(project["repo_path"])
+            # A failed mkdir doubles as the existence check; existing repos are left alone
+            try:
+                repo_path.mkdir(parents=True)
+            except FileExistsError:
+                continue
+            print(f"   Creating: {repo_path}")
+            
+            # A freshly created directory has no .git, so always set it up
+            self._create_project_structure(repo_path, project)
+        
+        print("✅ Project directories ready")
+    
+    def _create_project_structure(self, repo_path: Path, project: dict):
+        """Create basic project structure based on project type"""
+        project_type = project["type"].lower()
+        
+        # Create README
+        readme_content = self._readme_template.substitute(
+            project_name=project['name'],
+            project_type=project['type'],
+            requirements="\n".join(f"- {req}" for req in project['requirements']),
+            last_updated=time.strftime('%Y-%m-%d %H:%M:%S'),
+        )
+        with open(repo_path / "README.md", "wb") as f:
+            f.write(readme_content.encode())
+        
+        # Create basic structure based on project type
+        structure = next(
+            (STRUCTURE[kind] for keyword, kind in STRUCTURE_KEYWORDS if keyword in project_type),
+            STRUCTURE["default"]
+        )
+        for sub in structure:
+            (repo_path / sub).mkdir(parents=True, exist_ok=True)
+        
+        # Initialize the repo and make the initial commit in one shell
+        subprocess.run(
+            ["sh", "-c", "git init -q && git add -A && git commit -q -m 'Initial project setup by AI team'"],
+            cwd=repo_path, check=True
+        )
+    
+    def create_orchestrator(self):
+        """Create master orchestrator"""
+        print("🎯 Creating Master Orchestrator...")
+        
+        # Create session from a control-mode client that stays open for later commands
+        cmd = ["tmux", "-C", "new-session", "-s", self.session_name]
+        self._ctl = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                     text=True, encoding="utf-8", errors="replace")
+        # Pane output would flood the pipe. tmux before 3.2 lacks the flag, which
+        # is harmless, but a client that exited means new-session itself failed
+        try:
+            self._tmux("refresh-client", "-f", "no-output")
+        except subprocess.CalledProcessError:
+            if self._ctl.returncode is not None:
+                raise
+        
+        # Rename window
+        self._tmux("rename-window", "-t", f"{self.session_name}:0", "Orchestrator")
+        
+        self._tmux(*self._event_hook_commands())
+        
+        # Send orchestrator prompt
+        orchestrator_prompt = self._get_enhanced_orchestrator_prompt()
+        self._send_message_to_window(f"{self.session_name}:0", orchestrator_prompt)
+        
+        self.active_windows = 1
+        print("✅ Master Orchestrator online")
+    
+    def _event_hook_commands(self) -> List[str]:
+        """set-hook commands that report window changes to the monitor's FIFO
+
+        The hook shell gives up after a second, so a FIFO left behind by a
+        killed monitor cannot pile up blocked writers, and || true stops tmux
+        putting the pane in view mode to show a failed status.
+        """
+        fifo = shlex.quote(self.events_fifo)
+
+        def report(hook: str) -> str:
+            write = shlex.quote(f"echo {hook} > {fifo}")
+            return "run-shell -b " + _tmux_quote(f"test -p {fifo} && timeout 1 sh -c {write} || true")
+
+        commands = []
+        for hook in SESSION_EVENT_HOOKS:
+            commands += ["set-hook", "-t", self.session_name, hook, report(hook), ";"]
+        # A fixed slot per session in the global hook arrays leaves other
+        # sessions' hooks alone, and a relaunch overwrites rather than appends.
+        # The session-closed hook clears the slot once the team is gone
+        slot = int.from_bytes(hashlib.blake2b(self.session_name.encode(), digest_size=2).digest(), "big") + 1
+        guard = _tmux_quote(f"#{{==:#{{hook_session_name}},{self.session_name}}}")
+        for hook in GLOBAL_EVENT_HOOKS:
+            command = report(hook)
+            if hook == "session-closed":
+                command += "".join(f" ; set-hook -gu {h}[{slot}]" for h in GLOBAL_EVENT_HOOKS)
+            commands += ["set-hook", "-g", f"{hook}[{slot}]", f"if-shell -F {guard} {_tmux_quote(command)}", ";"]
+        return commands[:-1]
+
+    def setup_projects(self):
+        """Set up all projects from configuration"""
+        # One snapshot, so the window layout and the setup see the same projects
+        projects = team_config.PROJECTS
+        print(f"🏗️  Setting up {len(projects)} projects...")
+        
+        # Lay out every window index up front (the orchestrator owns window 0),
+        # so the projects share no counter and can be set up concurrently
+        pm_window_nums, dev_window_nums = [], []
+        next_window = 1
+        for project in projects:
+            team_size = len(project.get("team_roles", DEFAULT_TEAM_ROLES))
+            pm_window_nums.append(next_window)
+            dev_window_nums.append(list(range(next_window + 1, next_window + 1 + team_size)))
+            next_window += 1 + team_size
+        self.active_windows = next_window
+        
+        # Hand each staffed role's shared prompt block to tmux once
+        roles = dict.fromkeys(role for project in projects for role in project.get("team_roles", DEFAULT_TEAM_ROLES))
+        buffers, deletes = [], []
+        for role in roles:
+            # "--" because the block starts with "- " and would be read as flags
+            buffers += ["set-buffer", "-b", self._role_buffer(role), "--", self._role_prompts[role], ";"]
+            deletes += ["delete-buffer", "-b", self._role_buffer(role), ";"]
+        if buffers:
+            self._tmux(*buffers[:-1])
+        
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(8, len(projects)))) as ex:
+                list(ex.map(self.setup_single_project, projects, pm_window_nums, dev_window_nums))
+        finally:
+            if deletes:
+                self._tmux(*deletes[:-1], check=False)
+    
+    def _role_buffer(self, role: str) -> str:
+        """Name of the tmux paste buffer holding a role's shared prompt block"""
+        return f"{self.session_name}-role-{role}"
+    
+    def setup_single_project(self, project: dict, pm_window_num: int, dev_window_nums: List[int]):
+        """Set up a single project with its team.
+
+        The PM gets window ``pm_window_num`` and the developers, in
+        ``team_roles`` order, the windows in ``dev_window_nums``.
+        """
+        project_name = project["name"]
+        roles = project.get("team_roles", DEFAULT_TEAM_ROLES)
+        print(f"   📋 Setting up {project_name}...")
+        
+        # Create the PM window and the developer windows based on project team
+        # roles in one chained tmux command
+        pm_window = f"{self.session_name}:{pm_window_num}"
+        new_windows = ["new-window", "-t", pm_window, "-n", f"PM-{project_name}"]
+        dev_windows = {}
+        for dev_window_num, role in zip(dev_window_nums, roles):
+            dev_window = f"{self.session_name}:{dev_window_num}"
+            window_name = f"{_role_fragments(role)['title_nospace']}-{project_name}"
+            new_windows += [";", "new-window", "-t", dev_window, "-n", window_name]
+            dev_windows[role] = dev_window
+        self._tmux(*new_windows)
+        
+        # Store project info
+        self.projects[project_name] = {
+            **project,
+            "pm_window": pm_window,
+            "dev_windows": dev_windows,
+            "pm_window_num": pm_window_num
+        }
+        
+        # Start every agent first so their startup waits overlap
+        self._start_claude(pm_window, *dev_windows.values())
+        
+        # Initialize PM
+        # The numbered requirements list is the same for every prompt of this project
+        requirements = "\n".join(f"{i+1}. {req}" for i, req in enumerate(project['requirements']))
+        pm_prompt = self._get_enhanced_pm_prompt(project, dev_windows, requirements)
+        self._send_prompt(pm_window, pm_prompt)
+        
+        # Initialize developers
+        # Only the project-specific head and tail are sent; the role block is pasted
+        for role, window in dev_windows.items():
+            head, tail = self._get_developer_prompt_parts(role, project)
+            self._send_prompt(window, head, self._role_buffer(role), tail)
+        
+        print(f"      ✅ {project_name} team ready ({len(dev_windows) + 1} agents)")
+    
+    def _get_enhanced_orchestrator_prompt(self) -> str:
+        return self._orchestrator_prompt
+
+    def _get_enhanced_pm_prompt(self, project: dict, dev_windows: dict, requirements: Optional[str] = None) -> str:
+        if requirements is None:
+            requirements = "\n".join(f"{i+1}. {req}" for i, req in enumerate(project['requirements']))
+        team_lines = []
+        for role, window in dev_windows.items():
+            fragments = _role_fragments(role)
+            team_lines.append(f"- {fragments['title']}: {window} (Specializes in {fragments['focus']})")
+        team_list = "\n".join(team_lines)
+        
+        return self._pm_template.substitute(
+            project_name=project['name'],
+            project_name_upper=project['name'].upper(),
+            project_type=project['type'],
+            repo_path=project['repo_path'],
+            priority=project.get('priority', 'normal').upper(),
+            requirements=requirements,
+            team_list=team_list,
+        )
+
+    def _get_developer_prompt_parts(self, role: str, project: dict) -> Tuple[str, str]:
+        """The project-specific text sent before and after the role's buffer"""
+        fragments = _role_fragments(role)
+        head = _DEV_HEAD_TEMPLATE.substitute(
+            role_title=fragments['title'],
+            role_title_upper=fragments['title_upper'],
+            project_name=project['name'],
+            project_type=project['type'],
+            repo_path=project['repo_path'],
+        )
+        tail = _DEV_TAIL_TEMPLATE.substitute(
+            role_upper=role.upper(),
+            project_name=project['name'],
+            project_name_upper=project['name'].upper(),
+        )
+        return head, tail
+
+    def _get_enhanced_developer_prompt(self, role: str, project: dict) -> str:
+        head, tail = self._get_developer_prompt_parts(role, project)
+        return head + self._role_prompts[role] + tail
+
+    def _wait_for_claude_ready(self, window: str, timeout: float = CLAUDE_READY_TIMEOUT) -> bool:
+        """Poll a window until Claude's prompt is visible or the timeout expires.
+
+        Starts at 50 ms between polls and backs off up to 2 s.
+        """
+        interval = 0.05
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            screen = self._tmux("capture-pane", "-p", "-t", window, check=False)
+            if any(marker in screen for marker in CLAUDE_READY_MARKERS):
+                return True
+            time.sleep(interval)
+            interval = min(interval * 2, 2.0)
+        return False
 
     def _send_message_to_window(self, window: str, message: str):
         """Send message to tmux window with claude"""
-        # Clear any existing content
-        subprocess.run(["tmux", "send-keys", "-t", window, "C-c"], check=False)
-        time.sleep(0.5)
-        
-        # Start claude
-        subprocess.run(["tmux", "send-keys", "-t", window, "claude"], check=True)
-        time.sleep(2)
+        self._start_claude(window)
+        self._send_prompt(window, message)
+    
+    def _start_claude(self, *windows: str):
+        """Clear any existing content and start claude in each window, in one tmux call"""
+        keys = []
+        for window in windows:
+            keys += ["send-keys", "-t", window, "C-c", ";",
+                     "send-keys", "-t", window, "claude", "Enter", ";"]
+        self._tmux(*keys[:-1])
+    
+    def _send_prompt(self, window: str, message: str, buffer: Optional[str] = None, tail: str = ""):
+        """Wait for claude in a window started by _start_claude, then send it a message.
+
+        With ``buffer`` the message is followed by that tmux buffer's text
+        and then ``tail``, as if all three had been sent as one message.
+        """
+        self._wait_for_claude_ready(window)
         
-        # Send the message
-        subprocess.run(["tmux", "send-keys", "-t", window, message, "Enter"], check=True)
+        # Send the message literally, then submit it.  paste-buffer -s keeps
+        # newlines as typed by send-keys -l instead of turning them into CR
+        keys = ["send-keys", "-t", window, "-l", message, ";"]
+        if buffer:
+            keys += ["paste-buffer", "-b", buffer, "-s", "\n", "-t", window, ";"]
+        if tail:
+            keys += ["send-keys", "-t", window, "-l", tail, ";"]
+        self._tmux(*keys, "send-keys", "-t", window, "Enter")
     
     def setup_monitoring(self):
         """Set up autonomous monitoring and health checks"""
@@ -371,27 +678,92 @@ IMMEDIATE ACTIONS:
         # Schedule orchestrator check-ins
         schedule_cmd = [
             str(self.base_dir / "schedule_with_note.sh"),
-            str(TEAM_CONFIG["orchestrator_checkin"]),
-            f"🎯 ORCHESTRATOR: Review all {len(PROJECTS)} projects and coordinate teams"
+            str(team_config.TEAM_CONFIG["orchestrator_checkin"]),
+            f"🎯 ORCHESTRATOR: Review all {len(team_config.PROJECTS)} projects and coordinate teams"
         ]
         subprocess.run(schedule_cmd, check=True)
         
         print("✅ Autonomous monitoring activated")
     
     def _create_enhanced_monitor(self, script_path: Path):
-        """Create enhanced monitoring script"""
-        monitor_code = f'''#!/usr/bin/env python3
-"""
+        """Create enhanced monitoring script, unless the one on disk is already current"""
+        # The monitor only needs each project's name and (expanded) path
+        monitored = [{"name": p["name"], "repo_path": p["repo_path"]} for p in team_config.PROJECTS]
+        interval = team_config.TEAM_CONFIG['monitoring_interval']
+        monitor_code = f'''"""
 Enhanced Autonomous Team Monitor
 Continuously monitors team health, progress, and performance
 """
 
 import time
+import select
+import signal
+import stat
 import subprocess
-import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Optional
+
+from claude_control import get_status
+
+EVENTS_FIFO = {self.events_fifo!r}
+
+PROJECTS = {monitored}
+
+# Per-repo git checks are independent and may wait on git, so they run side by side
+_gitpool = ThreadPoolExecutor(max_workers=max(1, min(16, len(PROJECTS))), thread_name_prefix="git-check")
+
+
+class _GitBatchWorker:
+    """Long-running `git cat-file --batch` process answering HEAD lookups for one repo"""
+    
+    def __init__(self, repo_path):
+        self.proc = subprocess.Popen(
+            ["git", "-C", str(repo_path), "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+        )
+        self._lock = threading.Lock()  # One request/response in flight on the pipe
+    
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+    
+    def head_commit_time(self) -> int:
+        """Return the committer timestamp of HEAD"""
+        with self._lock:
+            self.proc.stdin.write(b"HEAD\\n")
+            self.proc.stdin.flush()
+            header = self.proc.stdout.readline().split()
+            if len(header) != 3:
+                raise RuntimeError(f"cat-file could not resolve HEAD: {{b' '.join(header).decode()}}")
+            
+            # Object body plus the trailing newline cat-file appends
+            body = self.proc.stdout.read(int(header[2]) + 1)
+        for line in body.splitlines():
+            if line.startswith(b"committer "):
+                return int(line.rsplit(b" ", 2)[1])
+            if not line:
+                break
+        raise RuntimeError("HEAD commit has no committer line")
+    
+    def close(self):
+        if self.alive():
+            self.proc.stdin.close()
+            try:
+                self.proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self.proc.kill()
+
+
+def _ts() -> str:
+    """Timestamp prefix used by the monitor's log lines"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+def _exit_on_signal(signum, frame):
+    # SystemExit unwinds through the loop's finally, which removes the FIFO
+    raise SystemExit(128 + signum)
 
 class TeamMonitor:
     def __init__(self):
@@ -399,62 +771,92 @@ class TeamMonitor:
         self.session_name = "{self.session_name}"
         self.last_health_check = datetime.now()
         self.alert_cooldown = {{}}  # Prevent spam alerts
+        self._git_workers = {{}}  # cat-file workers for repos whose refs cannot be stat()ed
         
-    def check_team_health(self):
+    def check_team_health(self, timestamp: Optional[str] = None):
         """Comprehensive team health monitoring"""
+        timestamp = timestamp or _ts()
         try:
-            result = subprocess.run([
-                "python3", str(self.base_dir / "claude_control.py"), "status", "detailed"
-            ], capture_output=True, text=True, check=True)
-            
-            status = json.loads(result.stdout)
+            # claude_control ships next to this script; its plain status is one
+            # tmux list-windows call, made in-process rather than via python3
             issues = []
             
-            # Check each session and window
-            for session in status.get("sessions", []):
-                if session["name"] == self.session_name:
-                    for window in session.get("windows", []):
-                        window_name = window.get("name", "unknown")
-                        
-                        # Check for inactive windows
-                        if not window.get("active", False):
-                            if self._should_alert("inactive", window_name):
-                                issues.append(f"🔴 INACTIVE: {{window_name}}")
-                        
-                        # Check for error patterns (if available)
-                        # This would require additional tmux content checking
-                        
+            # Check each window of our session
+            for session in get_status()["sessions"]:
+                if session["name"] != self.session_name:
+                    continue
+                for window in session["windows"]:
+                    window_name = window["name"] or "unknown"
+                    
+                    # Check for inactive windows
+                    if not window["active"]:
+                        if self._should_alert("inactive", window_name):
+                            issues.append(f"🔴 INACTIVE: {{window_name}}")
+                    
+                    # Check for error patterns (if available)
+                    # This would require additional tmux content checking
+
             if issues:
-                self._log_issues(issues)
+                self._log_issues(issues, timestamp)
             else:
-                self._log_success()
+                self._log_success(timestamp)
                 
         except Exception as e:
-            self._log_error(f"Health check failed: {{e}}")
+            self._log_error(f"Health check failed: {{e}}", timestamp)
     
-    def check_git_activity(self):
+    def check_git_activity(self, timestamp: Optional[str] = None):
         """Monitor git activity across all projects"""
-        projects = {PROJECTS}
+        # Cooldowns are only touched here, after every check has returned
+        issues = []
+        for project, issue in zip(PROJECTS, _gitpool.map(self._check_one, PROJECTS)):
+            if issue and self._should_alert("no_commits", project["name"]):
+                issues.append(issue)
         
-        for project in projects:
-            repo_path = Path(project["repo_path"])
-            if repo_path.exists():
-                try:
-                    # Check last commit time
-                    result = subprocess.run([
-                        "git", "log", "-1", "--format=%ct"
-                    ], cwd=repo_path, capture_output=True, text=True, check=True)
-                    
-                    last_commit_time = datetime.fromtimestamp(int(result.stdout.strip()))
-                    time_since_commit = datetime.now() - last_commit_time
-                    
-                    # Alert if no commits in over 2 hours
-                    if time_since_commit > timedelta(hours=2):
-                        if self._should_alert("no_commits", project["name"]):
-                            self._log_issues([f"⚠️  NO COMMITS: {{project['name']}} ({{time_since_commit}})"])
-                            
-                except Exception as e:
-                    self._log_error(f"Git check failed for {{project['name']}}: {{e}}")
+        if issues:
+            self._log_issues(issues, timestamp)
+    
+    def _check_one(self, project) -> Optional[str]:
+        """Check one project's last commit, returning an issue line if it is stale"""
+        repo_path = Path(project["repo_path"])
+        if not repo_path.exists():
+            return None
+        
+        try:
+            last_commit_time = datetime.fromtimestamp(self._last_commit_time(repo_path))
+            time_since_commit = datetime.now() - last_commit_time
+            
+            # Alert if no commits in over 2 hours
+            if time_since_commit > timedelta(hours=2):
+                return f"⚠️  NO COMMITS: {{project['name']}} ({{time_since_commit}})"
+                
+        except Exception as e:
+            self._log_error(f"Git check failed for {{project['name']}}: {{e}}")
+        return None
+    
+    def _last_commit_time(self, repo_path: Path) -> float:
+        """Epoch time of the repo's last commit"""
+        # Every commit rewrites its branch ref, so the newest ref mtime is the
+        # last commit time; fully packed repos only have packed-refs
+        git_dir = repo_path / ".git"
+        if git_dir.is_dir():
+            refs = [ref for ref in (git_dir / "refs" / "heads").rglob("*") if ref.is_file()]
+            if not refs and (git_dir / "packed-refs").is_file():
+                refs = [git_dir / "packed-refs"]
+            if refs:
+                return max(os.path.getmtime(ref) for ref in refs)
+        
+        # Worktrees and submodules keep their refs elsewhere; ask one long-lived
+        # git process instead of spawning git log every check
+        worker = self._git_workers.get(repo_path)
+        if worker is None or not worker.alive():
+            worker = self._git_workers[repo_path] = _GitBatchWorker(repo_path)
+        return worker.head_commit_time()
+    
+    def close(self):
+        """Stop the persistent git workers"""
+        for worker in self._git_workers.values():
+            worker.close()
+        self._git_workers.clear()
     
     def _should_alert(self, alert_type: str, identifier: str) -> bool:
         """Prevent alert spam with cooldown"""
@@ -468,64 +870,115 @@ class TeamMonitor:
         self.alert_cooldown[key] = now
         return True
     
-    def _log_issues(self, issues: list):
+    def _log_issues(self, issues: list, timestamp: Optional[str] = None):
         """Log issues with timestamp"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or _ts()
         print(f"[{{timestamp}}] 🚨 TEAM HEALTH ISSUES:")
         for issue in issues:
             print(f"  {{issue}}")
     
-    def _log_success(self):
+    def _log_success(self, timestamp: Optional[str] = None):
         """Log successful health check"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or _ts()
         print(f"[{{timestamp}}] ✅ All team members active and healthy")
     
-    def _log_error(self, error: str):
+    def _log_error(self, error: str, timestamp: Optional[str] = None):
         """Log monitoring errors"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        timestamp = timestamp or _ts()
         print(f"[{{timestamp}}] ❌ MONITOR ERROR: {{error}}")
     
     def run_monitoring_loop(self):
         """Main monitoring loop"""
         print("🤖 Enhanced Team Monitor starting...")
         print(f"Monitoring session: {{self.session_name}}")
-        print(f"Check interval: {TEAM_CONFIG['monitoring_interval']} seconds")
+        print(f"Check interval: {interval} seconds (or on tmux events)")
+        
+        interval = {interval}
+        signal.signal(signal.SIGTERM, _exit_on_signal)
+        signal.signal(signal.SIGHUP, _exit_on_signal)
+        try:
+            os.mkfifo(EVENTS_FIFO, 0o600)
+        except FileExistsError:
+            # Left by a monitor that was killed outright; reuse only our own FIFO
+            st = os.lstat(EVENTS_FIFO)
+            if not stat.S_ISFIFO(st.st_mode) or st.st_uid != os.getuid():
+                raise SystemExit(f"{{EVENTS_FIFO}} exists and is not this user's FIFO")
+        # Opened read-write so the FIFO never reports EOF between hook writers
+        fifo_fd = os.open(EVENTS_FIFO, os.O_RDWR | os.O_NONBLOCK)
         
-        while True:
-            self.check_team_health()
-            self.check_git_activity()
-            time.sleep({TEAM_CONFIG['monitoring_interval']})
+        try:
+            timestamp = _ts()
+            self.check_team_health(timestamp)
+            self.check_git_activity(timestamp)
+            next_git_check = time.monotonic() + interval
+            
+            while True:
+                # Health checks run when tmux reports a change or the interval passes
+                timeout = max(0, next_git_check - time.monotonic())
+                ready, _, _ = select.select([fifo_fd], [], [], timeout)
+                if ready:
+                    # Drain everything queued so a burst of events costs one check
+                    try:
+                        while os.read(fifo_fd, 4096):
+                            pass
+                    except BlockingIOError:
+                        pass
+                # One timestamp for every line logged this tick
+                timestamp = _ts()
+                self.check_team_health(timestamp)
+                
+                # Git activity keeps its own timer
+                if time.monotonic() >= next_git_check:
+                    self.check_git_activity(timestamp)
+                    next_git_check = time.monotonic() + interval
+        finally:
+            self.close()
+            os.close(fifo_fd)
+            os.unlink(EVENTS_FIFO)
 
 if __name__ == "__main__":
     monitor = TeamMonitor()
     monitor.run_monitoring_loop()
 '''
         
-        script_path.write_text(monitor_code)
+        # The script is fully determined by its text, so a hash of it on line 2
+        # tells whether the file on disk needs rewriting
+        stamp = f"# monitor-hash: {hashlib.blake2b(monitor_code.encode(), digest_size=8).hexdigest()}\n"
+        try:
+            with open(script_path) as f:
+                f.readline()
+                if f.readline() == stamp:
+                    return
+        except (OSError, UnicodeDecodeError):
+            pass
+        
+        script_path.write_text("#!/usr/bin/env python3\n" + stamp + monitor_code)
         script_path.chmod(0o755)
     
     def show_final_summary(self):
         """Show comprehensive setup summary"""
+        config, projects, standards = team_config.TEAM_CONFIG, team_config.PROJECTS, team_config.DEV_STANDARDS
         print("\n" + "="*80)
         print("🎉 AUTONOMOUS DEVELOPMENT TEAM DEPLOYMENT COMPLETE")
         print("="*80)
         
         print(f"\n📋 TEAM OVERVIEW:")
         print(f"  Session Name: {self.session_name}")
-        print(f"  Total Projects: {len(PROJECTS)}")
-        print(f"  Total Agents: {sum(len(p.get('team_roles', [])) + 1 for p in PROJECTS) + 1}")  # +1 for orchestrator
+        print(f"  Total Projects: {len(projects)}")
+        print(f"  Total Agents: {sum(len(p.get('team_roles', [])) + 1 for p in projects) + 1}")  # +1 for orchestrator
         print(f"  Active Windows: {self.active_windows}")
         
         print(f"\n🏗️  PROJECT BREAKDOWN:")
         window_num = 0
         print(f"  Window {window_num}: 🎯 Master Orchestrator")
         
-        for project_name, project_info in self.projects.items():
+        # Projects finish setup in any order; list them by window
+        for project_name, project_info in sorted(self.projects.items(), key=lambda item: item[1]['pm_window_num']):
             window_num = project_info['pm_window_num']
             print(f"  Window {window_num}: 📋 PM-{project_name} ({project_info['type']})")
             for role, window in project_info['dev_windows'].items():
                 window_num = int(window.split(':')[1])
-                role_title = ROLE_DEFINITIONS[role]['title']
+                role_title = _role_fragments(role)['title']
                 print(f"  Window {window_num}: 👨‍💻 {role_title}-{project_name}")
         
         print(f"\n🚀 QUICK START COMMANDS:")
@@ -535,18 +988,18 @@ if __name__ == "__main__":
         print(f"  python3 enhanced_monitor.py &             # Start monitoring (background)")
         
         print(f"\n⚙️  TEAM CONFIGURATION:")
-        print(f"  Auto-commit frequency: {DEV_STANDARDS['commit_frequency']} minutes")
-        print(f"  PM check-ins: Every {TEAM_CONFIG['pm_checkin']} minutes")
-        print(f"  Orchestrator check-ins: Every {TEAM_CONFIG['orchestrator_checkin']} minutes")
-        print(f"  Code review required: {DEV_STANDARDS['code_review_required']}")
-        print(f"  Testing required: {DEV_STANDARDS['testing_required']}")
+        print(f"  Auto-commit frequency: {standards['commit_frequency']} minutes")
+        print(f"  PM check-ins: Every {config['pm_checkin']} minutes")
+        print(f"  Orchestrator check-ins: Every {config['orchestrator_checkin']} minutes")
+        print(f"  Code review required: {standards['code_review_required']}")
+        print(f"  Testing required: {standards['testing_required']}")
         
         print(f"\n🎯 YOUR PROJECTS:")
-        for project in PROJECTS:
+        for project in projects:
             status_emoji = "🔴" if project.get('priority') == 'high' else "🟡" if project.get('priority') == 'medium' else "🟢"
             print(f"  {status_emoji} {project['name']}: {project['type']}")
             print(f"     📁 {project['repo_path']}")
-            print(f"     👥 Team: {', '.join([ROLE_DEFINITIONS[role]['title'] for role in project.get('team_roles', [])])}")
+            print(f"     👥 Team: {', '.join(_role_fragments(role)['title'] for role in project.get('team_roles', []))}")
         
         print(f"\n🤖 AUTONOMOUS FEATURES ACTIVE:")
         print("  ✅ Self-scheduling agents with automatic check-ins")
@@ -566,7 +1019,12 @@ def main():
     print("🤖 AUTONOMOUS DEVELOPMENT TEAM LAUNCHER")
     print("="*50)
     
-    team = EnhancedAutonomousTeam()
+    try:
+        team = EnhancedAutonomousTeam()
+    except (OSError, ValueError) as e:  # team_config.toml missing or malformed
+        print(f"❌ Error loading team configuration: {e}")
+        print("   Please ensure team_config.py and team_config.toml are in the same directory.")
+        return False
     
     # Pre-flight checks
     if not team.check_dependencies():
@@ -588,6 +1046,8 @@ def main():
     except Exception as e:
         print(f"\n❌ Setup failed: {e}")
         return False
+    finally:
+        team.close()
 
 if __name__ == "__main__":
     success = main()
@@ -5,6 +5,7 @@ Starts both the autonomous team and InsightFactory integration
 """
 
 import os
+import shutil
 import sys
 from pathlib import Path
 from enhanced_autonomous_team import EnhancedAutonomousTeam
@@ -19,20 +20,41 @@ try:
 except ImportError:
     print("Note: InsightFactory integration not available, continuing with core functionality...")
 
-def main():
-    # Check for GitHub token
+# Worker threads in the team's own work-stealing pool
+MAX_WORKERS = 10
+
+def _preflight() -> None:
+    """Check every cheap precondition in one pass, before anything is started."""
+    problems = []
     if not os.getenv("GITHUB_TOKEN"):
-        print("❌ GitHub token not found. Please set the GITHUB_TOKEN environment variable.")
+        problems.append("GitHub token not found. Please set the GITHUB_TOKEN environment variable.")
+    for tool in ("tmux", "git"):
+        if not shutil.which(tool):
+            problems.append(f"{tool} not found on PATH.")
+    # The team writes status.log into these, creating any that are missing
+    for repo_dir in EnhancedAutonomousTeam.STATUS_REPOS:
+        path = Path(repo_dir).expanduser()
+        existing = next(p for p in (path, *path.parents) if p.exists())
+        if not existing.is_dir():
+            problems.append(f"{existing} is not a directory, so {path} cannot be used.")
+        elif not os.access(existing, os.W_OK | os.X_OK):
+            problems.append(f"{existing} is not writable, so {path} cannot be used.")
+    if problems:
+        for problem in problems:
+            print(f"❌ {problem}")
         sys.exit(1)
 
+def main():
+    _preflight()
+
     # Configure and start the enhanced autonomous team
     team_config = {
         'session_name': 'enhanced-dev-team',
-        'base_dir': str(Path(__file__).parent),
+        'base_dir': str(SCRIPT_DIR),
         'github_token': os.getenv("GITHUB_TOKEN"),
         'auto_optimize': True,
         'min_workers': 1,
-        'max_workers': 10
+        'max_workers': MAX_WORKERS
     }
 
     print("🚀 Launching Enhanced Autonomous Development Environment...")
@@ -1,161 +1,245 @@
 # Autonomous Dev Team Configuration
-# Customize your projects and team structure here
+# The settings themselves live in team_config.toml next to this file;
+# customize your projects and team structure there.
 
+import functools
 import os
+import sys
+import time
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 
-# Base configuration
-TEAM_CONFIG = {
-    "session_name": "autonomous-dev-team",
-    "base_dir": Path(__file__).parent,
-    "monitoring_interval": 600,  # seconds between health checks
-    "orchestrator_checkin": 120,  # minutes between orchestrator check-ins
-    "pm_checkin": 30,  # minutes between PM check-ins
-}
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    import tomli as tomllib
 
-# Your Projects - Customize these for your actual work
-PROJECTS = [
-    {
-        "name": "AITaskManager",
-        "type": "Full-Stack Task Management App",
-        "repo_path": os.path.expanduser("~/dev-projects/ai-task-manager"),
-        "github_repo": "swanhtet01/ai-task-manager",
-        "requirements": [
-            "User authentication with JWT",
-            "Task CRUD operations with React frontend", 
-            "Real-time collaboration features",
-            "Docker containerization and deployment",
-            "Complete CI/CD pipeline with GitHub Actions",
-            "Monitoring with Prometheus and Grafana"
-        ],
-        "priority": "high",
-        "team_roles": ["frontend", "backend", "devops", "qa"],
-        "github_issues": [1, 2, 3]  # Track the issues we just created
-    },
-    {
-        "name": "DemoProject", 
-        "type": "Learning & Experimentation",
-        "repo_path": os.path.expanduser("~/dev-projects/demo-experiments"),
-        "requirements": [
-            "Test new technologies and frameworks",
-            "Prototype innovative features",
-            "Performance benchmarking",
-            "Code quality experiments"
-        ],
-        "priority": "low",
-        "team_roles": ["backend", "frontend"]
-    }
-]
-
-# Team Role Definitions
-ROLE_DEFINITIONS = {
-    "frontend": {
-        "title": "Frontend Engineer",
-        "specializations": [
-            "React/Vue/Angular development",
-            "CSS/SCSS styling and responsive design", 
-            "JavaScript/TypeScript",
-            "UI/UX implementation",
-            "Performance optimization",
-            "Cross-browser compatibility"
-        ],
-        "tools": ["npm/yarn", "webpack/vite", "browser dev tools", "figma/sketch"]
-    },
-    "backend": {
-        "title": "Backend Engineer", 
-        "specializations": [
-            "API design and development",
-            "Database design and optimization",
-            "Authentication and security",
-            "Server-side logic and architecture",
-            "Third-party integrations", 
-            "Performance and scalability"
-        ],
-        "tools": ["Node.js/Python/Go", "databases", "API testing tools", "cloud services"]
-    },
-    "devops": {
-        "title": "DevOps Engineer",
-        "specializations": [
-            "CI/CD pipeline setup",
-            "Infrastructure as code",
-            "Container orchestration",
-            "Monitoring and logging",
-            "Security and compliance",
-            "Cloud deployment and scaling"
-        ],
-        "tools": ["docker", "kubernetes", "terraform", "jenkins/github-actions", "monitoring tools"]
-    },
-    "qa": {
-        "title": "QA Engineer",
-        "specializations": [
-            "Test planning and strategy",
-            "Automated testing frameworks",
-            "Manual testing and exploratory testing",
-            "Performance and load testing",
-            "Bug reporting and tracking",
-            "Quality metrics and documentation"
-        ],
-        "tools": ["selenium/cypress", "jest/mocha", "postman", "jira/linear", "performance testing tools"]
-    }
-}
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "team_config.toml")
 
-# Git and Development Standards
-DEV_STANDARDS = {
-    "commit_frequency": 30,  # minutes
-    "code_review_required": True,
-    "testing_required": True,
-    "documentation_required": True,
-    "branch_naming": "feature/task-description",
-    "commit_message_format": "type(scope): description",
-    "max_work_session": 4,  # hours before mandatory break
-}
+# Per-project fields also kept column-wise, one tuple per field, for bulk scans
+_COLUMN_FIELDS = ("name", "type", "priority", "team_roles")
 
-# Escalation Rules
-ESCALATION_RULES = {
-    "blocked_time_limit": 60,  # minutes before escalating to PM
-    "pm_blocked_time_limit": 120,  # minutes before escalating to orchestrator  
-    "critical_issues": [
-        "Security vulnerabilities",
-        "Data loss or corruption",
-        "Production outages",
-        "Legal/compliance issues"
-    ],
-    "human_intervention_triggers": [
-        "Project deadline at risk",
-        "Budget concerns", 
-        "Scope changes needed",
-        "External dependencies blocking progress"
-    ]
-}
+# The file is stat()ed at most this often; edits show up within this long
+_RECHECK_INTERVAL = 1.0  # seconds
+
+# path -> [(st_mtime_ns, st_size), parsed config, monotonic time of next stat()]
+_CONFIG_CACHE = {}
+
+# name -> (parse it was built from, value) for every section built so far
+_CACHE = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _expand(path):
+    """expanduser once per distinct path"""
+    return os.path.expanduser(path)
+
+
+class LazyProject(dict):
+    """A project entry whose ``repo_path`` gets its ``~`` expanded on first read
+
+    Iterating, ``items()`` and ``values()`` (and so ``dict(project)`` or
+    ``{**project}``) expand it too, so copies never see the raw path.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._resolved = "repo_path" not in self
+
+    def _resolve(self):
+        if not self._resolved:
+            dict.__setitem__(self, "repo_path", _expand(dict.__getitem__(self, "repo_path")))
+            self._resolved = True
+
+    def __getitem__(self, key):
+        if key == "repo_path":
+            self._resolve()
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if key == "repo_path":
+            self._resolve()
+        return dict.get(self, key, default)
+
+    def __iter__(self):
+        self._resolve()
+        return dict.__iter__(self)
+
+    def items(self):
+        self._resolve()
+        return dict.items(self)
+
+    def values(self):
+        self._resolve()
+        return dict.values(self)
+
+
+class TeamConfig(Mapping):
+    """The [team] table plus ``base_dir``, readable as ``cfg["key"]`` or ``cfg.key``
+
+    ``base_dir`` is the directory holding team_config.toml; its Path is only
+    built the first time someone asks for it.
+    """
+
+    def __init__(self, table):
+        self._table = table
+
+    @functools.cached_property
+    def base_dir(self):
+        return Path(CONFIG_PATH).parent
+
+    def __getitem__(self, key):
+        if key == "base_dir":
+            return self.base_dir
+        return self._table[key]
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self):
+        yield from self._table
+        yield "base_dir"
+
+    def __len__(self):
+        return len(self._table) + 1
+
+    def __repr__(self):
+        return f"{type(self).__name__}({dict(self)!r})"
+
+
+def _freeze(obj):
+    """Lists become tuples and every string (keys included) is interned"""
+    if isinstance(obj, dict):
+        return {sys.intern(k) if isinstance(k, str) else k: _freeze(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return tuple(_freeze(x) for x in obj)
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    return obj
+
+
+def _load(path=CONFIG_PATH):
+    """Parse ``path``, reusing the last parse until the file's mtime or size changes"""
+    now = time.monotonic()
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and now < cached[2]:
+        return cached[1]
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    if cached is not None and cached[0] == key:
+        cached[2] = now + _RECHECK_INTERVAL
+        return cached[1]
+    with open(path, "rb") as f:
+        config = _freeze(tomllib.load(f))
+    _CONFIG_CACHE[path] = [key, config, now + _RECHECK_INTERVAL]
+    return config
 
-# Monitoring and Reporting
-MONITORING_CONFIG = {
-    "health_check_interval": 300,  # seconds
-    "progress_report_interval": 3600,  # seconds (1 hour)
-    "daily_summary": True,
-    "weekly_summary": True,
-    "metrics_to_track": [
-        "commits_per_day",
-        "issues_resolved",
-        "code_coverage",
-        "build_success_rate",
-        "deployment_frequency"
-    ]
-}
 
-# Slack/Discord Integration (optional)
-NOTIFICATIONS = {
-    "enabled": False,
-    "webhook_url": "",  # Add your webhook URL here
-    "channels": {
-        "general": "#dev-team",
-        "alerts": "#dev-alerts", 
-        "deployments": "#deployments"
-    },
-    "notification_types": [
-        "project_completed",
-        "critical_errors",
-        "deployment_status",
-        "daily_summaries"
-    ]
+def _build_team_config(raw):
+    return TeamConfig(raw["team"])
+
+
+def _build_projects(raw):
+    return tuple(LazyProject(p) for p in raw.get("projects", ()))
+
+
+def _build_role_definitions(raw):
+    return MappingProxyType(raw["roles"])
+
+
+def _build_dev_standards(raw):
+    return MappingProxyType(raw["dev_standards"])
+
+
+def _build_escalation_rules(raw):
+    rules = raw["escalation_rules"]
+    # Only ever asked "is x in it?"
+    return MappingProxyType({
+        **rules,
+        "critical_issues": frozenset(rules["critical_issues"]),
+        "human_intervention_triggers": frozenset(rules["human_intervention_triggers"]),
+    })
+
+
+def _build_monitoring_config(raw):
+    monitoring = raw["monitoring"]
+    return MappingProxyType({**monitoring, "metrics_to_track": frozenset(monitoring["metrics_to_track"])})
+
+
+def _build_notifications(raw):
+    return MappingProxyType(raw["notifications"])
+
+
+def _build_columns(raw):
+    # dict.get skips LazyProject's repo_path hook; no column needs the path
+    projects = _section("PROJECTS", _build_projects)
+    cols = {field: tuple(dict.get(p, field) for p in projects) for field in _COLUMN_FIELDS}
+    cols["priority"] = tuple(prio or "normal" for prio in cols["priority"])
+    cols["team_roles"] = tuple(frozenset(roles or ()) for roles in cols["team_roles"])
+    return cols
+
+
+# Module attributes built on first access, all of them read-only
+_SECTIONS = {
+    "TEAM_CONFIG": _build_team_config,
+    "PROJECTS": _build_projects,
+    "ROLE_DEFINITIONS": _build_role_definitions,
+    "DEV_STANDARDS": _build_dev_standards,
+    "ESCALATION_RULES": _build_escalation_rules,
+    "MONITORING_CONFIG": _build_monitoring_config,
+    "NOTIFICATIONS": _build_notifications,
 }
+
+
+def _section(name, builder):
+    """``builder``'s view of the current parse, rebuilt only after the file changes"""
+    raw = _load()
+    cached = _CACHE.get(name)
+    if cached is not None and cached[0] is raw:
+        return cached[1]
+    val = builder(raw)
+    _CACHE[name] = (raw, val)
+    return val
+
+
+def _columns():
+    return _section("_columns", _build_columns)
+
+
+def projects_by_priority(prio):
+    """Indexes into PROJECTS of the projects with priority ``prio``"""
+    return tuple(i for i, p in enumerate(_columns()["priority"]) if p == prio)
+
+
+def projects_for_role(role):
+    """Indexes into PROJECTS of the projects staffing ``role``"""
+    return _projects_for_role(_columns()["team_roles"], role)
+
+
+@functools.lru_cache(maxsize=16)
+def _projects_for_role(roles, role):
+    # Keyed on the column tuple too, so a reload never serves a stale answer
+    return tuple(i for i, rs in enumerate(roles) if role in rs)
+
+
+def project(i):
+    """Row view of project ``i``: name, type, priority and team_roles (a frozenset)"""
+    cols = _columns()
+    return SimpleNamespace(**{field: cols[field][i] for field in _COLUMN_FIELDS})
+
+
+def __getattr__(name):
+    builder = _SECTIONS.get(name)
+    if builder is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return _section(name, builder)
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_SECTIONS))
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for GitHubManager's git command-line push path
+Run with: python -m unittest test_github_manager
+"""
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+from github_manager import GitHubManager
+
+
+def git(*args, cwd):
+    return subprocess.run(["git", *args], cwd=cwd, check=True,
+                          capture_output=True, text=True).stdout
+
+
+class PushWithGitTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.remote = os.path.join(self._tmp.name, "remote.git")
+        self.work = os.path.join(self._tmp.name, "work")
+        git("init", "-q", "--bare", self.remote, cwd=self._tmp.name)
+        git("init", "-q", "-b", "main", self.work, cwd=self._tmp.name)
+        with open(os.path.join(self.work, "a.txt"), "w") as f:
+            f.write("hello\n")
+
+    def test_push_with_token(self):
+        GitHubManager(self.work, token="t")._push_with_git(self.work, "first", self.remote)
+        self.assertEqual(git("log", "--format=%s", "main", cwd=self.remote), "first\n")
+
+    def test_failed_commit_stops_push(self):
+        manager = GitHubManager(self.work, token="t")
+        manager._push_with_git(self.work, "first", self.remote)
+        pushed = git("rev-parse", "main", cwd=self.remote)
+        # A failing step must stop the chain, or "git push" reports success
+        hook = os.path.join(self.work, ".git", "hooks", "pre-commit")
+        with open(hook, "w") as f:
+            f.write("#!/bin/sh\nexit 1\n")
+        os.chmod(hook, 0o755)
+        with open(os.path.join(self.work, "b.txt"), "w") as f:
+            f.write("more\n")
+        with self.assertRaises(subprocess.CalledProcessError):
+            manager._push_with_git(self.work, "second", self.remote)
+        self.assertEqual(git("rev-parse", "main", cwd=self.remote), pushed)
+
+    def test_failed_remote_add_stops_push(self):
+        manager = GitHubManager(self.work, token="t")
+        with self.assertRaises(subprocess.CalledProcessError):
+            manager._push_with_git(self.work, "first", "-not-a-remote")
+        self.assertEqual(git("remote", cwd=self.work), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
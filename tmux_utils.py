@@ -109,8 +109,56 @@ class TmuxOrchestrator:
             print(f"Error getting tmux sessions: {e}")
             return []
     
+    def get_window_activity(self) -> List[Dict]:
+        """Get the history size and last activity time of every window.
+
+        A single ``tmux list-windows -a`` call covers all sessions, so a
+        monitor can tell which panes changed before capturing any content.
+        Errors are reported and result in an empty list, as in
+        ``get_tmux_sessions``.
+        """
+        try:
+            cmd = [
+                "tmux",
+                "list-windows",
+                "-a",
+                "-F",
+                "#{window_id}\t#{session_name}\t#{window_index}\t"
+                "#{history_size}\t#{window_activity}\t#{window_name}",
+            ]
+            result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        except FileNotFoundError:
+            print(
+                "Warning: 'tmux' executable not found. Install tmux to use the "
+                "orchestrator features."
+            )
+            return []
+        except subprocess.CalledProcessError as e:
+            print(f"Error getting window activity: {e}")
+            return []
+
+        windows = []
+        for line in result.stdout.splitlines():
+            # The window name comes last since it may itself contain tabs.
+            parts = line.split("\t", 5)
+            if len(parts) != 6:
+                continue
+            window_id, session_name, window_index, history_size, activity, name = parts
+            windows.append({
+                "id": window_id,
+                "session_name": session_name,
+                "index": int(window_index),
+                "history_size": int(history_size),
+                "activity": int(activity),
+                "name": name,
+            })
+        return windows
+
     def capture_window_content(self, session_name: str, window_index: int, num_lines: int = 50) -> str:
-        """Safely capture the last N lines from a tmux window"""
+        """Safely capture the last N lines from a tmux window.
+
+        ``num_lines=0`` captures only the visible region of the pane.
+        """
         if num_lines > self.max_lines_capture:
             num_lines = self.max_lines_capture
             